@@ -0,0 +1,81 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from processor import Processor
+
+WORDS = ["hello", "World", "python", "Straße", "queue", "rhythm", "a1b2", "don't", "--", "Éclair"]
+SPACES = [" ", " ", " ", "  ", "\n", "\t"]
+
+
+def make_file(size_mb):
+    random.seed(42)
+    file = tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False)
+    with file:
+        target = size_mb * 1024 * 1024
+        written = 0
+        while written < target:
+            line = "".join(random.choice(WORDS) + random.choice(SPACES) for _ in range(1000))
+            file.write(line)
+            written += len(line)
+    return file.name
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+
+    # NOTE: Memory is measured in a second run, tracemalloc slows the timing down
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def current_methods(file_name):
+    with open(file_name, "r", encoding="utf-8") as file:
+        process = Processor(file.read().casefold())
+    vowels = process.count_vowels()
+    letters = process._count_letters()
+    return process.count_words(), vowels, letters - vowels, letters
+
+
+def scaling(file_name, max_workers, expected):
+    print("\nWorkers   Time      Speedup")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        result = Processor.count_file_parallel(file_name, workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        match = "" if result == expected else "  MISMATCH"
+        print(f"{workers:7d} {elapsed:8.3f}s {baseline / elapsed:8.2f}x{match}")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    file_name = make_file(size_mb)
+    try:
+        old, old_time, old_peak = timed(current_methods, file_name)
+        new, new_time, new_peak = timed(Processor.count_file, file_name)
+        small, small_time, small_peak = timed(Processor.count_file, file_name, 4099)
+
+        print(f"Input: {size_mb} MB")
+        print(f"Current methods : {old_time:8.3f}s  peak {old_peak / 2**20:8.1f} MB")
+        print(f"Streaming (1 MB): {new_time:8.3f}s  peak {new_peak / 2**20:8.1f} MB")
+        print(f"Streaming (4 KB): {small_time:8.3f}s  peak {small_peak / 2**20:8.1f} MB")
+        print(f"Results match   : {old == new == small} {new}")
+
+        scaling(file_name, max_workers, new)
+    finally:
+        os.remove(file_name)
+
+
+if __name__ == "__main__":
+    main()
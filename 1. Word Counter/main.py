@@ -1,21 +1,42 @@
+import sys
 from processor import Processor
 
-string = input("Enter a String: ").casefold()
-
-process = Processor(string)
-
-while True:
-    choice = input("1. Count Words\n2. Count Vowels\n3. Count Consonants\n0. Exit\nEnter your Choice: ")
-
-    match choice:
-        case "1":
-            print(process.count_words())
-        case "2":
-            print(process.count_vowels())
-        case "3":
-            print(process.count_consonants())
-        case "0":
-            print("Thank You For Using the Application\nGoodBye!!!")
-            exit()
-        case _:
-            print("Invalid Input. Please Try Again.")
\ No newline at end of file
+
+# NOTE: Worker processes re-import this module under spawn (Windows, macOS), so nothing may run at import time
+def main():
+    if len(sys.argv) > 1:
+        if sys.argv[1] == "-":
+            words, vowels, consonants, letters = Processor.count_stream(sys.stdin)
+        elif len(sys.argv) > 2:
+            words, vowels, consonants, letters = Processor.count_file_parallel(sys.argv[1], int(sys.argv[2]))
+        else:
+            words, vowels, consonants, letters = Processor.count_file(sys.argv[1])
+        print(f"Words: {words}"
+              f"\nVowels: {vowels}"
+              f"\nConsonants: {consonants}"
+              f"\nLetters: {letters}")
+        return
+
+    string = input("Enter a String: ").casefold()
+
+    process = Processor(string)
+
+    while True:
+        choice = input("1. Count Words\n2. Count Vowels\n3. Count Consonants\n0. Exit\nEnter your Choice: ")
+
+        match choice:
+            case "1":
+                print(process.count_words())
+            case "2":
+                print(process.count_vowels())
+            case "3":
+                print(process.count_consonants())
+            case "0":
+                print("Thank You For Using the Application\nGoodBye!!!")
+                exit()
+            case _:
+                print("Invalid Input. Please Try Again.")
+
+
+if __name__ == "__main__":
+    main()
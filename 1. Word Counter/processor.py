@@ -1,3 +1,13 @@
+import codecs
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
+
+CHUNK_SIZE = 1024 * 1024
+VOWELS = "aeiou"
+WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+SHARDS_PER_WORKER = 4
+
 
 class Processor:
     def __init__(self, string): 
@@ -23,6 +33,90 @@ class Processor:
     
     def count_consonants(self):
         return self._count_letters() - self.count_vowels()
+
+    @staticmethod
+    def _count_chunks(chunks):
+        words = vowels = letters = 0
+        in_word = False
+        for chunk in chunks:
+            if not chunk:
+                continue
+            chunk = chunk.casefold()
+            words += len(chunk.split())
+            # NOTE: A word cut in half by the chunk boundary was counted twice
+            if in_word and not chunk[0].isspace():
+                words -= 1
+            in_word = not chunk[-1].isspace()
+            vowels += sum(chunk.count(vowel) for vowel in VOWELS)
+            letters += sum(map(str.isalpha, chunk))
+        return words, vowels, letters - vowels, letters
+
+    @staticmethod
+    def count_stream(stream, chunk_size=CHUNK_SIZE):
+        return Processor._count_chunks(iter(lambda: stream.read(chunk_size), ""))
+
+    @staticmethod
+    def count_file(file_name, chunk_size=CHUNK_SIZE):
+        with open(file_name, "r", encoding="utf-8", errors="replace") as file:
+            return Processor.count_stream(file, chunk_size)
+
+    @staticmethod
+    def _shard_boundaries(file_name, shards):
+        size = os.path.getsize(file_name)
+        boundaries = [0]
+        with open(file_name, "rb") as file:
+            for i in range(1, shards):
+                offset = max(size * i // shards, boundaries[-1])
+                file.seek(offset)
+                # NOTE: Move the cut forward to the next whitespace byte so no word is split.
+                # ASCII bytes never appear inside a multi-byte UTF-8 character.
+                while True:
+                    block = file.read(64 * 1024)
+                    if not block:
+                        offset = size
+                        break
+                    hits = [index for index in map(block.find, WHITESPACE) if index != -1]
+                    if hits:
+                        offset += min(hits)
+                        break
+                    offset += len(block)
+                if offset > boundaries[-1]:
+                    boundaries.append(offset)
+        if size > boundaries[-1]:
+            boundaries.append(size)
+        return boundaries
+
+    @staticmethod
+    def _read_shard(file_name, start, end, chunk_size):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        with open(file_name, "rb") as file:
+            file.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                block = file.read(min(chunk_size, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                yield decoder.decode(block)
+        yield decoder.decode(b"", final=True)
+
+    @staticmethod
+    def _count_shard(shard):
+        return Processor._count_chunks(Processor._read_shard(*shard))
+
+    @staticmethod
+    def count_file_parallel(file_name, workers=None, chunk_size=CHUNK_SIZE):
+        workers = workers or os.cpu_count()
+        if workers == 1:
+            return Processor.count_file(file_name, chunk_size)
+
+        boundaries = Processor._shard_boundaries(file_name, workers * SHARDS_PER_WORKER)
+        shards = [(file_name, start, end, chunk_size) for start, end in pairwise(boundaries)]
+        with ProcessPoolExecutor(workers) as executor:
+            partials = list(executor.map(Processor._count_shard, shards))
+        if not partials:
+            return 0, 0, 0, 0
+        return tuple(map(sum, zip(*partials)))
     
 
 # NOTE: Test Code
@@ -0,0 +1,132 @@
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+from records import StudentRecords
+from scores import ScoreStore
+from summary import CohortSummary
+
+SUBJECTS = 6
+
+
+def make_students(count):
+    random.seed(3)
+    return [(str(uuid.uuid4()), [float(random.randint(0, 100)) for _ in range(SUBJECTS)]) for _ in range(count)]
+
+
+def python_loops(students):
+    # What the per-student list code would have to do for the same numbers
+    everything = [score for _, scores in students for score in scores]
+    mean = sum(everything) / len(everything)
+    stdev = math.sqrt(sum((score - mean) ** 2 for score in everything) / len(everything))
+    ordered = sorted(everything)
+    median = ordered[len(ordered) // 2]
+    histogram = [0] * 10
+    for score in everything:
+        histogram[min(int(score // 10), 9)] += 1
+    return mean, stdev, median, histogram
+
+
+def columnar(store):
+    return store.mean(), store.stdev(), store.percentile(50), store.histogram()
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def read_text(file_name):
+    # The old display_students() parsing, plus turning the numbers back into floats
+    with open(file_name, "r") as file:
+        return [(name, student_id, float(highest), float(lowest), float(average))
+                for name, student_id, highest, lowest, average in
+                (line.strip().split(", ") for line in file.readlines())]
+
+
+def records_benchmark(students, folder):
+    text_file = os.path.join(folder, "students.txt")
+    data_file = os.path.join(folder, "students.dat")
+    with open(text_file, "w") as file:
+        for i, (student_id, scores) in enumerate(students):
+            file.write(f"Student {i}, {student_id}, {max(scores)}, {min(scores)}, {sum(scores) / len(scores)}\n")
+
+    converted, seconds = timed(StudentRecords.convert, text_file, data_file)
+    print(f"\nConvert {converted} students : {seconds * 1000:.1f}ms")
+    print(f"Text file size           : {os.path.getsize(text_file) / 2**20:.2f} MB")
+    print(f"Binary file size         : {os.path.getsize(data_file) / 2**20:.2f} MB")
+
+    text, text_load = timed(read_text, text_file)
+    binary, binary_load = timed(list, StudentRecords(data_file, None))
+    print(f"Load text (split)        : {text_load * 1000:.1f}ms")
+    print(f"Load binary (mmap)       : {binary_load * 1000:.1f}ms")
+    assert text == [(name, StudentRecords.format_id(id_bytes), highest, lowest, average)
+                    for name, id_bytes, highest, lowest, average in binary]
+    assert all(StudentRecords.format_id(uuid.UUID(student_id).bytes) == student_id for _, student_id, *_ in text[:1000])
+    print("Records match")
+    return data_file
+
+
+def summary_benchmark(data_file, folder):
+    summary_file = os.path.join(folder, "students.summary")
+    _, rebuild = timed(CohortSummary, summary_file, data_file)
+    print(f"\nSummary from scratch     : {rebuild * 1000:.1f}ms")
+
+    def query():
+        summary = CohortSummary(summary_file, data_file)
+        return summary.mean(), summary.stdev(), summary.top(), summary.distribution()
+    _, opened = timed(query)
+    print(f"Open summary and query   : {opened * 1000:.3f}ms")
+
+    records = StudentRecords(data_file, None)
+    start = time.perf_counter()
+    for i in range(1000):
+        summary = CohortSummary(summary_file, data_file)
+        covered = records.append(f"New Student {i}", str(uuid.uuid4()), 90.0, 70.0, 80.0)
+        summary.add(f"New Student {i}", bytes(16), 90.0, 70.0, 80.0, covered)
+    print(f"Incremental update       : {(time.perf_counter() - start) / 1000 * 1e6:.1f}us")
+
+    problems, verify = timed(CohortSummary(summary_file, data_file, rebuild=False).verify)
+    print(f"Verify                   : {verify * 1000:.1f}ms, {len(problems)} problems")
+    assert not problems
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    students = make_students(count)
+    with tempfile.TemporaryDirectory() as folder:
+        files = [os.path.join(folder, name) for name in ("scores.dat", "scores.ends", "scores.ids")]
+        store = ScoreStore(*files)
+        start = time.perf_counter()
+        for student_id, scores in students:
+            store.add(student_id, scores)
+        print(f"Students: {count}, scores: {count * SUBJECTS}")
+        print(f"Add (append to 3 files)  : {(time.perf_counter() - start) / count * 1e6:.1f}us")
+
+        store, load = timed(ScoreStore, *files)
+        print(f"Load                     : {load * 1000:.1f}ms")
+
+        expected, loops = timed(python_loops, students)
+        got, vectorized = timed(columnar, store)
+        print(f"Python loops             : {loops * 1000:.1f}ms")
+        print(f"Columnar store (first)   : {vectorized * 1000:.1f}ms")
+        _, repeated = timed(columnar, store)
+        print(f"Columnar store (repeat)  : {repeated * 1000:.1f}ms")
+
+        assert math.isclose(expected[0], got[0]) and math.isclose(expected[1], got[1], rel_tol=1e-9)
+        assert [count for _, _, count in got[3]] == expected[3]
+        student_id, scores = random.choice(students)
+        assert list(store.scores(student_id)) == scores
+        print("Results match")
+
+        data_file = records_benchmark(students, folder)
+        summary_benchmark(data_file, folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,18 @@
+import sys
+
 import utils
+from scores import ScoreStore
+
+# python main.py convert [students.txt] [-o students.dat] [--force] turns an old text file into the binary format
+if sys.argv[1:2] == ["convert"]:
+    utils.convert_text(sys.argv[2:])
+    exit()
+# python main.py verify recomputes the cohort summary from scratch and reports any drift
+if sys.argv[1:2] == ["verify"]:
+    utils.verify_summary()
+    exit()
+
+store = ScoreStore()
 
 while True:
     utils.beautify("Grade Calculator")
@@ -6,14 +20,20 @@ while True:
     choice = input("\n"
                    "\n1. Add Student"
                    "\n2. View Students"
+                   "\n3. Cohort Statistics"
+                   "\n4. Cohort Summary"
                    "\n0. Exit"
                    "\nEnter Your Choice: ")
 
     match choice:
         case "1":
-            utils.add_student()
+            utils.add_student(store)
         case "2":
             utils.display_students()
+        case "3":
+            utils.cohort_statistics(store)
+        case "4":
+            utils.cohort_summary()
         case "0":
             print("Thank You for using the Application"
                   "\nGoodbye!!!")
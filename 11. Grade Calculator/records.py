@@ -0,0 +1,92 @@
+import mmap
+import os
+import struct
+import uuid
+
+DATA_FILE = "students.dat"
+TEXT_FILE = "students.txt"
+MAGIC = b"GRADES01"
+# UUID bytes, highest, lowest, average, name length, then the UTF-8 name
+RECORD = struct.Struct("<16sdddH")
+
+
+class StudentRecords:
+    def __init__(self, file_name=DATA_FILE, legacy_file=TEXT_FILE):
+        self._file_name = file_name
+        if not os.path.exists(file_name):
+            if legacy_file and os.path.exists(legacy_file):
+                self.convert(legacy_file, file_name)
+            else:
+                with open(file_name, "wb") as file:
+                    file.write(MAGIC)
+
+    @staticmethod
+    def pack(name, student_id, highest, lowest, average):
+        name = name.encode("utf-8")
+        return RECORD.pack(uuid.UUID(student_id).bytes, highest, lowest, average, len(name)) + name
+
+    @staticmethod
+    def format_id(id_bytes):
+        # Same text as str(uuid.UUID(bytes=...)), without building a UUID object per record
+        h = id_bytes.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def append(self, name, student_id, highest, lowest, average):
+        # One write() per record, the file is never parsed to add to it. Returns the new file size.
+        with open(self._file_name, "ab") as file:
+            file.write(self.pack(name, student_id, highest, lowest, average))
+            return file.tell()
+
+    @staticmethod
+    def parse_text_line(line):
+        # NOTE: The last four fields never contain ", ", so splitting from the right
+        # keeps names like "Rahaman, Taifur" in one piece
+        name, student_id, highest, lowest, average = line.rstrip("\n").rsplit(", ", 4)
+        return name, student_id, float(highest), float(lowest), float(average)
+
+    @staticmethod
+    def convert(text_file, file_name=DATA_FILE, force=False):
+        # Written next to the target and renamed over it, so a bad line leaves the old file alone.
+        # NOTE: An existing file holds every student added since it was made, it is only replaced with force
+        if os.path.exists(file_name) and not force:
+            raise FileExistsError(f"{file_name} already exists")
+        count = 0
+        temp_name = file_name + ".tmp"
+        with open(text_file, "r", encoding="utf-8") as source:
+            try:
+                with open(temp_name, "wb") as file:
+                    file.write(MAGIC)
+                    for line in source:
+                        if line.strip():
+                            file.write(StudentRecords.pack(*StudentRecords.parse_text_line(line)))
+                            count += 1
+            except BaseException:
+                if os.path.exists(temp_name):
+                    os.remove(temp_name)
+                raise
+        os.replace(temp_name, file_name)
+        return count
+
+    def __iter__(self):
+        with open(self._file_name, "rb") as file:
+            if os.fstat(file.fileno()).st_size <= len(MAGIC):
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:len(MAGIC)] != MAGIC:
+                    raise ValueError(f"{self._file_name} is not a student records file")
+                offset = len(MAGIC)
+                end = len(data)
+                unpack_from = RECORD.unpack_from
+                while offset + RECORD.size <= end:
+                    id_bytes, highest, lowest, average, name_length = unpack_from(data, offset)
+                    start = offset + RECORD.size
+                    offset = start + name_length
+                    if offset > end:
+                        break
+                    # NOTE: The ID stays as 16 raw bytes, format_id() only runs for what gets shown
+                    yield data[start:offset].decode("utf-8"), id_bytes, highest, lowest, average
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -0,0 +1,146 @@
+import bisect
+import math
+import os
+import uuid
+from array import array
+from collections import Counter
+from itertools import accumulate
+from operator import mul
+
+SCORES_FILE = "scores.dat"
+ENDS_FILE = "scores.ends"
+IDS_FILE = "scores.ids"
+ID_SIZE = 16
+MAX_SCORE = 100.0
+BINS = 10
+
+
+class ScoreStore:
+    # Columnar layout: every score of every student sits in one array of doubles.
+    # Student i owns scores[ends[i - 1]:ends[i]], and ids holds its 16 UUID bytes at i * 16.
+    # Per-student (highest, lowest, average) live in students.dat only, this store keeps the raw scores.
+    def __init__(self, scores_file=SCORES_FILE, ends_file=ENDS_FILE, ids_file=IDS_FILE):
+        self._files = (scores_file, ends_file, ids_file)
+        self._load()
+
+    @staticmethod
+    def _read_array(type_code, file_name):
+        values = array(type_code)
+        if os.path.exists(file_name):
+            with open(file_name, "rb") as file:
+                data = file.read()
+            values.frombytes(data[:len(data) - len(data) % values.itemsize])
+        return values
+
+    def _load(self):
+        scores_file, ends_file, ids_file = self._files
+        self._scores = self._read_array("d", scores_file)
+        self._ends = self._read_array("Q", ends_file)
+        self._ids = bytearray()
+        if os.path.exists(ids_file):
+            with open(ids_file, "rb") as file:
+                self._ids = bytearray(file.read())
+
+        # NOTE: Scores are written first and ids last, so a crash mid-append leaves extra
+        # rows behind in the earlier files. Only students that made it into every file count.
+        count = min(len(self._ends), len(self._ids) // ID_SIZE)
+        while count and self._ends[count - 1] > len(self._scores):
+            count -= 1
+        del self._ends[count:]
+        del self._ids[count * ID_SIZE:]
+        del self._scores[self._ends[-1] if count else 0:]
+        # Cut the leftovers off on disk too, or the next append would land out of step
+        sizes = (len(self._scores) * 8, count * 8, count * ID_SIZE)
+        for file_name, size in zip(self._files, sizes):
+            if os.path.exists(file_name) and os.path.getsize(file_name) > size:
+                os.truncate(file_name, size)
+        self._positions = None
+        self._counts = None
+
+    def add(self, student_id, scores):
+        scores = array("d", scores)
+        if not scores:
+            raise ValueError("A student needs at least one score")
+        id_bytes = uuid.UUID(student_id).bytes
+        end = array("Q", [len(self._scores) + len(scores)])
+        for values, file_name in zip((scores, end), self._files):
+            with open(file_name, "ab") as file:
+                values.tofile(file)
+        with open(self._files[2], "ab") as file:
+            file.write(id_bytes)
+
+        self._scores.extend(scores)
+        self._ends.extend(end)
+        self._ids += id_bytes
+        if self._positions is not None:
+            self._positions[id_bytes] = len(self._ends) - 1
+        if self._counts is not None:
+            self._counts.update(scores)
+
+    def __len__(self):
+        return len(self._ends)
+
+    def position(self, student_id):
+        if self._positions is None:
+            ids = (bytes(self._ids[i:i + ID_SIZE]) for i in range(0, len(self._ids), ID_SIZE))
+            self._positions = dict(zip(ids, range(len(self._ends))))
+        return self._positions.get(uuid.UUID(student_id).bytes)
+
+    def scores(self, student_id):
+        position = self.position(student_id)
+        if position is None:
+            return None
+        start = self._ends[position - 1] if position else 0
+        return self._scores[start:self._ends[position]]
+
+    @staticmethod
+    def summary(scores):
+        # (highest, lowest, average) of one student, computed once when it is saved to students.dat
+        return max(scores), min(scores), math.fsum(scores) / len(scores)
+
+    def _value_counts(self):
+        # NOTE: Scores are typed in by hand, so there are only a few hundred distinct values.
+        # Percentiles and histograms work on this small table instead of sorting every score.
+        if self._counts is None:
+            self._counts = Counter(self._scores)
+        return self._counts
+
+    def mean(self):
+        return math.fsum(self._scores) / len(self._scores) if self._scores else 0.0
+
+    def stdev(self):
+        if not self._scores:
+            return 0.0
+        mean = self.mean()
+        variance = math.fsum(map(mul, self._scores, self._scores)) / len(self._scores) - mean * mean
+        return math.sqrt(max(variance, 0.0))
+
+    def percentile(self, *percents):
+        if not self._scores:
+            return [0.0] * len(percents)
+        counts = self._value_counts()
+        values = sorted(counts)
+        # ranks[i] is the rank of the last copy of values[i] in the sorted scores
+        ranks = list(accumulate(map(counts.__getitem__, values), initial=-1))[1:]
+        results = []
+        for percent in percents:
+            # Linear interpolation between the two closest ranks
+            rank = (len(self._scores) - 1) * percent / 100
+            low = bisect.bisect_left(ranks, math.floor(rank))
+            high = bisect.bisect_left(ranks, math.ceil(rank), low)
+            results.append(values[low] + (values[high] - values[low]) * (rank - math.floor(rank)))
+        return results
+
+    def histogram(self, bins=BINS):
+        width = MAX_SCORE / bins
+        buckets = Counter()
+        for value, count in self._value_counts().items():
+            buckets[int(value / width)] += count
+        # A perfect 100 belongs in the last bucket, not one past it
+        buckets[bins - 1] += buckets.pop(bins, 0)
+        return [(i * width, (i + 1) * width, buckets.get(i, 0)) for i in range(bins)]
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -1,14 +1,20 @@
 import uuid
+from array import array
 
-FILE_NAME = "students.txt"
+from records import StudentRecords
+from scores import ScoreStore
+from summary import CohortSummary
+
+FILE_NAME = "students.dat"
 
 class Student:
-    def __init__(self, student_name="John Doe"):
+    def __init__(self, student_name="John Doe", store=None):
         self._student_name = student_name
         self._student_id_generator()
-        self.std_scores = []
+        self.std_scores = array("d")
         self.scores()
-        self.save_to_file()
+        self._highest, self._lowest, self._average = ScoreStore.summary(self.std_scores)
+        self.save_to_file(store)
 
     def _student_id_generator(self):
         self._student_id = str(uuid.uuid4())
@@ -29,13 +35,21 @@ class Student:
     def __str__(self):
         return (f"Student Name: {self._student_name},"
                 f"\nStudent ID: {self._student_id},"
-                f"\nHighest Score : {max(self.std_scores)}"
-                f"\nLowest Score : {min(self.std_scores)}"
-                f"\nAverage Score : {sum(self.std_scores) / len(self.std_scores)}")
-
-    def save_to_file(self):
-        with open(FILE_NAME, "a") as file:
-            file.write(f"{self._student_name}, {self._student_id}, {max(self.std_scores)}, {min(self.std_scores)}, {sum(self.std_scores) / len(self.std_scores)}\n")
+                f"\nHighest Score : {self._highest}"
+                f"\nLowest Score : {self._lowest}"
+                f"\nAverage Score : {self._average}")
+
+    def save_to_file(self, store=None):
+        records = StudentRecords(FILE_NAME)
+        # Opened before the append, while it still matches the file it covers
+        summary = CohortSummary(records_file=FILE_NAME)
+        covered = records.append(self._student_name, self._student_id,
+                                 self._highest, self._lowest, self._average)
+        summary.add(self._student_name, uuid.UUID(self._student_id).bytes,
+                    self._highest, self._lowest, self._average, covered)
+        # NOTE: The records file only keeps the aggregates, the raw scores go to the columnar store
+        if store is not None:
+            store.add(self._student_id, self.std_scores)
 
 
 
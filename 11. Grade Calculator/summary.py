@@ -0,0 +1,166 @@
+import math
+import os
+import struct
+
+from records import DATA_FILE, StudentRecords
+
+SUMMARY_FILE = "students.summary"
+MAGIC = b"COHORT02"
+BINS = 10
+MAX_SCORE = 100.0
+# magic, students.dat size it covers, count, mean, sum of squared deviations (Welford's M2),
+# top average, top student UUID, bottom average, highest score, lowest score, per-bin counts,
+# top name length, then the UTF-8 top name
+HEADER = struct.Struct(f"<8sQQddd16sddd{BINS}QH")
+
+
+class CohortSummary:
+    # NOTE: students.dat is the one source of truth for per-student aggregates, this file only
+    # holds cohort figures derived from it, and both menu reports read them from here
+    def __init__(self, file_name=SUMMARY_FILE, records_file=DATA_FILE, rebuild=True):
+        self._file_name = file_name
+        self._records_file = records_file
+        self._reset()
+        self._loaded = self._load()
+        # Missing, or out of step with students.dat after a crash or a convert, start over.
+        # verify() opens it with rebuild=False so it still sees the drift.
+        if rebuild and not self.in_step():
+            self.rebuild()
+
+    def _reset(self):
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._top = (-1.0, bytes(16), "")
+        self._bottom = math.inf
+        self._range = (-math.inf, math.inf)
+        self._bins = [0] * BINS
+        self._covered = 0
+
+    def _records_size(self):
+        return os.path.getsize(self._records_file) if os.path.exists(self._records_file) else 0
+
+    def in_step(self):
+        return self._loaded and self._covered == self._records_size()
+
+    def _load(self):
+        if not os.path.exists(self._file_name):
+            return False
+        with open(self._file_name, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER.size or data[:len(MAGIC)] != MAGIC:
+            return False
+        magic, covered, count, mean, m2, top_average, top_id, bottom, highest, lowest, *rest = \
+            HEADER.unpack_from(data)
+        bins, name_length = rest[:BINS], rest[BINS]
+        self._covered, self.count, self._mean, self._m2 = covered, count, mean, m2
+        self._bottom, self._range = bottom, (highest, lowest)
+        self._bins = list(bins)
+        top_name = data[HEADER.size:HEADER.size + name_length].decode("utf-8")
+        self._top = (top_average, top_id, top_name)
+        return True
+
+    def _save(self):
+        top_average, top_id, top_name = self._top
+        top_name = top_name.encode("utf-8")
+        temp_name = self._file_name + ".tmp"
+        with open(temp_name, "wb") as file:
+            file.write(HEADER.pack(MAGIC, self._covered, self.count, self._mean, self._m2,
+                                   top_average, top_id, self._bottom, *self._range, *self._bins,
+                                   len(top_name)) + top_name)
+        os.replace(temp_name, self._file_name)
+
+    def _update(self, name, id_bytes, highest, lowest, average):
+        # Welford's algorithm: the mean and variance move with each new value, no re-scan needed
+        self.count += 1
+        delta = average - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (average - self._mean)
+        if average > self._top[0]:
+            self._top = (average, id_bytes, name)
+        self._bottom = min(self._bottom, average)
+        self._range = (max(self._range[0], highest), min(self._range[1], lowest))
+        self._bins[min(int(average / (MAX_SCORE / BINS)), BINS - 1)] += 1
+
+    def add(self, name, id_bytes, highest, lowest, average, covered):
+        self._update(name, id_bytes, highest, lowest, average)
+        self._covered = covered
+        self._save()
+
+    def rebuild(self):
+        self._reset()
+        if os.path.exists(self._records_file):
+            for name, id_bytes, highest, lowest, average in StudentRecords(self._records_file, None):
+                self._update(name, id_bytes, highest, lowest, average)
+            self._covered = os.path.getsize(self._records_file)
+        self._loaded = True
+        self._save()
+
+    def mean(self):
+        return self._mean
+
+    def stdev(self):
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def top(self):
+        # (average, UUID bytes, name) of the best student, or None when there are no students
+        return self._top if self.count else None
+
+    def bottom(self):
+        # Worst student average
+        return self._bottom if self.count else None
+
+    def score_range(self):
+        # (highest, lowest) single score of any student
+        return self._range if self.count else None
+
+    def distribution(self):
+        width = MAX_SCORE / BINS
+        return [(i * width, (i + 1) * width, count) for i, count in enumerate(self._bins)]
+
+    def verify(self):
+        # Recomputes everything from students.dat with a plain two-pass calculation
+        # and lists where the stored summary has drifted from it. Open with rebuild=False,
+        # or the constructor has already replaced a drifted summary.
+        averages = []
+        top = (-1.0, bytes(16), "")
+        highest = -math.inf
+        lowest = math.inf
+        bins = [0] * BINS
+        if os.path.exists(self._records_file):
+            for name, id_bytes, student_highest, student_lowest, average in StudentRecords(self._records_file, None):
+                averages.append(average)
+                if average > top[0]:
+                    top = (average, id_bytes, name)
+                highest = max(highest, student_highest)
+                lowest = min(lowest, student_lowest)
+                bins[min(int(average / (MAX_SCORE / BINS)), BINS - 1)] += 1
+        count = len(averages) or 1
+        mean = math.fsum(averages) / count
+        stdev = math.sqrt(math.fsum((average - mean) ** 2 for average in averages) / count)
+
+        problems = []
+        if not self._loaded:
+            problems.append(f"{self._file_name} is missing or not a summary file")
+        elif self._covered != self._records_size():
+            problems.append(f"size: covers {self._covered} bytes of {self._records_file}, which has {self._records_size()}")
+        if len(averages) != self.count:
+            problems.append(f"count: stored {self.count}, actual {len(averages)}")
+        if not math.isclose(mean, self.mean(), rel_tol=1e-9, abs_tol=1e-9):
+            problems.append(f"mean: stored {self.mean()}, actual {mean}")
+        if not math.isclose(stdev, self.stdev(), rel_tol=1e-6, abs_tol=1e-9):
+            problems.append(f"standard deviation: stored {self.stdev()}, actual {stdev}")
+        if top != self._top:
+            problems.append(f"top scorer: stored {self._top[2]!r}, actual {top[2]!r}")
+        if min(averages, default=math.inf) != self._bottom:
+            problems.append(f"worst average: stored {self._bottom}, actual {min(averages, default=math.inf)}")
+        if (highest, lowest) != self._range:
+            problems.append(f"score range: stored {self._range}, actual {(highest, lowest)}")
+        if bins != self._bins:
+            problems.append(f"distribution: stored {self._bins}, actual {bins}")
+        return problems
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
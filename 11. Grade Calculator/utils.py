@@ -1,28 +1,106 @@
+import argparse
+
+from records import DATA_FILE, TEXT_FILE, StudentRecords
 from students import Student
+from summary import CohortSummary
 
 def beautify(string):
     print("="*40)
     print(string.center(40))
     print("="*40)
 
-def add_student():
-    Student(input("Enter Your Name: "))
+def add_student(store):
+    Student(input("Enter Your Name: "), store)
 
 def display_students():
     count = 0
-    with open("students.txt", "r") as file:
-        students = file.readlines()
-    if not students:
+    for name, id_bytes, highest, lowest, average in StudentRecords():
+        count += 1
+        beautify(f"Student : {count}")
+        print(f"\nName: {name}"
+              f"\nID: {StudentRecords.format_id(id_bytes)}"
+              f"\nHighest Score: {highest}"
+              f"\nLowest Score: {lowest}"
+              f"\nAverage Score: {average}")
+    if not count:
+        print("No Students Found")
+
+def convert_text(args=None):
+    parser = argparse.ArgumentParser(prog="main.py convert", description="Convert an old students.txt into the binary format.")
+    parser.add_argument("text_file", nargs="?", default=TEXT_FILE, help=f"text file to convert (default: {TEXT_FILE})")
+    parser.add_argument("-o", "--output", default=DATA_FILE, help=f"binary file to write (default: {DATA_FILE})")
+    parser.add_argument("--force", action="store_true", help="replace the output file if it already exists")
+    args = parser.parse_args(args)
+
+    try:
+        count = StudentRecords.convert(args.text_file, args.output, args.force)
+    except FileExistsError:
+        existing = sum(1 for _ in StudentRecords(args.output, None))
+        print(f"Skipped: {args.output} already holds {existing} students, {args.text_file} was not converted."
+              f"\nUse -o to write somewhere else, or --force to replace it"
+              f" (the students added since it was made would be lost, their scores stay in scores.*)")
+        return
+    except (OSError, ValueError) as e:
+        print(f"Could not convert {args.text_file}: {e}")
+        return
+    print(f"Converted {count} students from {args.text_file} to {args.output}")
+
+def cohort_statistics(store):
+    # NOTE: Student figures come from the same CohortSummary as cohort_summary(), so both reports
+    # agree. Only the per-score figures need the raw scores, which older students do not have.
+    summary = CohortSummary()
+    if not summary.count:
         print("No Students Found")
         return
-    else:
-        for student in students:
-            student = student.strip()
-            count += 1
-            student = student.split(", ")
-            beautify(f"Student : {count}")
-            print(f"\nName: {student[0]}"
-                  f"\nID: {student[1]}"
-                  f"\nHighest Score: {student[2]}"
-                  f"\nLowest Score: {student[3]}"
-                  f"\nAverage Score: {student[4]}")
\ No newline at end of file
+    highest, lowest = summary.score_range()
+    beautify("Cohort Statistics")
+    print(f"\nStudents: {summary.count}"
+          f"\nClass Average: {summary.mean():.2f}"
+          f"\nStandard Deviation: {summary.stdev():.2f}"
+          f"\nBest Student Average: {summary.top()[0]:.2f}"
+          f"\nWorst Student Average: {summary.bottom():.2f}"
+          f"\nHighest Score: {highest}"
+          f"\nLowest Score: {lowest}")
+    if not len(store):
+        print("\nNo individual scores recorded")
+        return
+    p25, median, p75, p90 = store.percentile(25, 50, 75, 90)
+    print(f"\nIndividual Scores ({len(store)} of {summary.count} students have them):"
+          f"\nScore Average: {store.mean():.2f}"
+          f"\nScore Standard Deviation: {store.stdev():.2f}"
+          f"\nPercentiles: 25th {p25:.2f}, median {median:.2f}, 75th {p75:.2f}, 90th {p90:.2f}"
+          f"\n\nScore Distribution:")
+    histogram = store.histogram()
+    largest = max(count for _, _, count in histogram) or 1
+    for low, high, count in histogram:
+        print(f"{low:>5.0f}-{high:<4.0f}| {'#' * round(count / largest * 30)} {count}")
+
+def cohort_summary():
+    summary = CohortSummary()
+    if not summary.count:
+        print("No Students Found")
+        return
+    top_average, id_bytes, top_name = summary.top()
+    beautify("Cohort Summary")
+    print(f"\nStudents: {summary.count}"
+          f"\nClass Average: {summary.mean():.2f}"
+          f"\nStandard Deviation: {summary.stdev():.2f}"
+          f"\nTop Scorer: {top_name} ({StudentRecords.format_id(id_bytes)}), average {top_average:.2f}"
+          f"\n\nAverage Score Distribution:")
+    distribution = summary.distribution()
+    largest = max(count for _, _, count in distribution) or 1
+    for low, high, count in distribution:
+        print(f"{low:>5.0f}-{high:<4.0f}| {'#' * round(count / largest * 30)} {count}")
+
+def verify_summary():
+    # Opened without the automatic rebuild, or a drifted summary would be fixed before it is checked
+    summary = CohortSummary(rebuild=False)
+    problems = summary.verify()
+    if not problems:
+        print("Summary matches students.dat")
+        return
+    print("Summary has drifted from students.dat:")
+    for problem in problems:
+        print(f"  {problem}")
+    summary.rebuild()
+    print("Summary rebuilt from scratch")
@@ -0,0 +1,57 @@
+import random
+import sys
+import time
+
+from search import ContactIndex
+
+FIRST = ["Abdur", "Taifur", "Monira", "Sajib", "Forhad", "Tazbiul", "Nusrat", "Rafiq", "Salma", "Kamal",
+         "Farzana", "Habib", "Jamal", "Shirin", "Tanvir", "Rumana", "Imran", "Sadia", "Arif", "Mitu"]
+LAST = ["Rahaman", "Rahim", "Ahmed", "Hasan", "Labony", "Hossain", "Islam", "Akter", "Chowdhury", "Karim"]
+QUERIES = 200
+
+
+def make_contacts(count):
+    random.seed(11)
+    contacts = {}
+    while len(contacts) < count:
+        name = f"{random.choice(FIRST)} {random.choice(LAST)} {random.randint(1, count)}"
+        contacts[name] = f"+8801{random.randint(3, 9)}{random.randint(0, 99_999_999):08d}"
+    return contacts
+
+
+def typo(name):
+    position = random.randrange(len(name))
+    return name[:position] + random.choice("aeiou") + name[position + 1:]
+
+
+def average_ms(function, queries):
+    start = time.perf_counter()
+    for query in queries:
+        function(query)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'Contacts':>9} {'Build':>8} {'Exact':>9} {'Prefix':>9} {'Phone':>9} {'Fuzzy<=1':>9} {'Fuzzy<=2':>9}")
+    for size in sizes:
+        contacts = make_contacts(size)
+        names = random.sample(list(contacts), QUERIES)
+
+        start = time.perf_counter()
+        index = ContactIndex(contacts)
+        build = time.perf_counter() - start
+
+        exact = average_ms(contacts.get, names)
+        prefix = average_ms(index.prefix_names, [name[:random.randint(2, 8)] for name in names])
+        phone = average_ms(index.prefix_phones, [contacts[name][:random.randint(6, 10)] for name in names])
+        fuzzy_queries = [typo(name) for name in names[:20]]
+        fuzzy_1 = average_ms(lambda query: index.fuzzy_names(query, 1), fuzzy_queries)
+        fuzzy_2 = average_ms(lambda query: index.fuzzy_names(query, 2), fuzzy_queries)
+
+        print(f"{size:>9} {build:>7.2f}s {exact:>7.4f}ms {prefix:>7.4f}ms {phone:>7.4f}ms "
+              f"{fuzzy_1:>7.2f}ms {fuzzy_2:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
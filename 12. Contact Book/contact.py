@@ -1,13 +1,14 @@
 import re
 
-FILE_NAME = "contact.txt"
+from storage import ContactStore
 
 
 class Contact:
-    def __init__(self, user_name = "John Doe", user_phone = "+8801234567890"):
+    def __init__(self, user_name = "John Doe", user_phone = "+8801234567890", store = None):
         self._usr_name = user_name
         self._usr_phone = self._phone_validity(user_phone)
-        self._save_on_file()
+        if store is not None:
+            self._save(store)
 
     @staticmethod
     def _phone_validity(user_phone):
@@ -17,13 +18,12 @@ class Contact:
         else:
             raise ValueError("Invalid Phone Number")
 
-    def _save_on_file(self):
-        with open(FILE_NAME, "a") as file:
-            file.write(f"{self._usr_name},{self._usr_phone}\n")
+    def _save(self, store):
+        store.put(self._usr_name, self._usr_phone)
 
     def __str__(self):
         return (f"\nName: {self._usr_name}"
                 f"\nPhone: {self._usr_phone}")
 
 if __name__ == "__main__":
-    contact = Contact("Taifur Rahaman", "+8801777620949")
\ No newline at end of file
+    contact = Contact("Taifur Rahaman", "+8801777620949", ContactStore())
\ No newline at end of file
@@ -1,7 +1,5 @@
 from contact import Contact
 
-FILE_NAME = "contact.txt"
-
 def beautify(text):
     print("="*40)
     print(text.center(40))
@@ -12,18 +10,8 @@ def add_contact():
     phone = input("Enter Your Phone Number: ")
     return name, phone
 
-def store_from_file():
-    contacts = {}
-    try:
-        with open(FILE_NAME, "r") as file:
-            for line in file:
-                name, phone = line.strip().split(",")
-                contacts[name] = phone
-    except FileNotFoundError:
-        with open(FILE_NAME, "w") as file:
-            pass
-    else:
-        return contacts
+def store_from_file(store):
+    return store.load()
 
 def show_contact(contacts):
     beautify("Contact List")
@@ -34,42 +22,43 @@ def show_contact(contacts):
         print(f"Phone: {phone}".center(40))
         print("-" * 40)
 
-def delete_contact(contacts):
+def delete_contact(contacts, store, index):
     name = input("Enter the contact Name you want to delete: ")
     try:
         del contacts[name]
-        with open(FILE_NAME, "r") as file:
-            lines = file.readlines()
-        with open(FILE_NAME,"w") as file:
-            for line in lines:
-                if name not in line:
-                    file.write(line)
+        store.delete(name)
+        index.remove(name)
     except KeyError:
         print("Contact Not Found")
     else:
         print("Contact Deleted Successfully")
 
-def update_contact(contacts):
+def update_contact(contacts, store, index):
     try:
         name = input("Enter the contact Name you want to update: ")
+        if name not in contacts:
+            raise KeyError(name)
         phone = input("Enter the contact Phone you want to update: ")
+        Contact(name, phone, store)
         contacts[name] = phone
-        with open(FILE_NAME, "r") as file:
-            lines = file.readlines()
-        with open(FILE_NAME,"w") as file:
-            for line in lines:
-                if name not in line:
-                    file.write(line)
-        Contact(name, phone)
+        index.add(name, phone)
     except KeyError:
         print("Contact Not Found")
+    except ValueError as e:
+        print(e)
     else:
         print("Contact Updated Successfully")
 
-def search_contact(contacts):
-    name = input("Enter the contact Name you want to search: ")
+def search_contact(contacts, index):
+    name = input("Enter the contact Name or Phone you want to search: ")
     try:
         print(f"Name: {name}")
         print(f"Phone: {contacts[name]}")
     except KeyError:
-        print("Contact Not Found")
\ No newline at end of file
+        matches = index.search(name)
+        if not matches:
+            print("Contact Not Found")
+            return
+        print("Did you mean:")
+        for match in matches:
+            print(f"- {match}: {contacts[match]}")
\ No newline at end of file
@@ -1,7 +1,11 @@
 import functionalities as func
 from contact import Contact
+from search import ContactIndex
+from storage import ContactStore
 
-contacts = func.store_from_file()
+store = ContactStore()
+contacts = func.store_from_file(store)
+index = ContactIndex(contacts)
 
 while True:
     func.beautify("Contact Book")
@@ -19,20 +23,22 @@ while True:
         case "1":
             name, phone = func.add_contact()
             try:
-                Contact(name, phone)
+                Contact(name, phone, store)
             except ValueError as e:
                 print(e)
             else:
                 contacts[name] = phone
+                index.add(name, phone)
         case "2":
             func.show_contact(contacts)
         case "3":
-            func.delete_contact(contacts)
+            func.delete_contact(contacts, store, index)
         case "4":
-            func.update_contact(contacts)
+            func.update_contact(contacts, store, index)
         case "5":
-            func.search_contact(contacts)
+            func.search_contact(contacts, index)
         case "0":
+            store.close()
             print("Thank You for Using the Application"
                   "\nGoodbye!!!")
             exit()
@@ -0,0 +1,117 @@
+import bisect
+import heapq
+import os
+
+MAX_DISTANCE = 2
+TOP_K = 5
+LAST_CHAR = chr(0x10FFFF)
+
+
+class ContactIndex:
+    def __init__(self, contacts):
+        self._contacts = dict(contacts)
+        self._names = sorted((name.casefold(), name) for name in self._contacts)
+        self._phones = sorted((key, name) for name, phone in self._contacts.items()
+                              for key in self._phone_keys(phone))
+
+    @staticmethod
+    def normalize_phone(phone):
+        return "".join(filter(str.isdigit, phone))
+
+    @staticmethod
+    def _phone_keys(phone):
+        digits = ContactIndex.normalize_phone(phone)
+        # NOTE: "+8801712..." is also indexed as "01712..." so the local form finds it too
+        if digits.startswith("880"):
+            return [digits, digits[2:]]
+        return [digits]
+
+    def add(self, name, phone):
+        if name in self._contacts:
+            self.remove(name)
+        self._contacts[name] = phone
+        bisect.insort(self._names, (name.casefold(), name))
+        for key in self._phone_keys(phone):
+            bisect.insort(self._phones, (key, name))
+
+    def remove(self, name):
+        phone = self._contacts.pop(name, None)
+        if phone is None:
+            return
+        self._names.pop(bisect.bisect_left(self._names, (name.casefold(), name)))
+        for key in self._phone_keys(phone):
+            self._phones.pop(bisect.bisect_left(self._phones, (key, name)))
+
+    @staticmethod
+    def _prefix(entries, prefix, k):
+        results = []
+        start = bisect.bisect_left(entries, (prefix,))
+        for key, name in entries[start:start + k] if k else entries[start:]:
+            if not key.startswith(prefix):
+                break
+            results.append(name)
+        return results
+
+    def prefix_names(self, prefix, k=TOP_K):
+        return self._prefix(self._names, prefix.casefold(), k)
+
+    def prefix_phones(self, prefix, k=TOP_K):
+        digits = self.normalize_phone(prefix)
+        if not digits:
+            return []
+        # The same contact can match through both of its phone keys
+        return list(dict.fromkeys(self._prefix(self._phones, digits, 2 * k if k else 0)))[:k or None]
+
+    def fuzzy_names(self, query, max_distance=MAX_DISTANCE, k=TOP_K):
+        query = query.casefold()
+        names = self._names
+        # rows[d] is the edit-distance row for the first d characters of the current key.
+        # Neighbouring keys in sorted order share prefixes, so their rows are reused like a trie walk.
+        rows = [list(range(len(query) + 1))]
+        previous = ""
+        results = []
+        i = 0
+        while i < len(names):
+            key, name = names[i]
+            common = min(len(os.path.commonprefix([previous, key])), len(rows) - 1)
+            del rows[common + 1:]
+
+            pruned = 0
+            for depth in range(common, len(key)):
+                above = rows[-1]
+                row = [above[0] + 1]
+                for column, char in enumerate(query, 1):
+                    cost = 0 if char == key[depth] else 1
+                    row.append(min(row[-1] + 1, above[column] + 1, above[column - 1] + cost))
+                rows.append(row)
+                if min(row) > max_distance:
+                    pruned = depth + 1
+                    break
+
+            if pruned:
+                # Nothing that starts with this prefix can get back under the limit, skip all of it
+                previous = key[:pruned]
+                i = bisect.bisect_left(names, (previous + LAST_CHAR,), i)
+                continue
+
+            distance = rows[-1][-1]
+            if distance <= max_distance:
+                results.append((distance, key, name))
+            previous = key
+            i += 1
+        return [name for _, _, name in heapq.nsmallest(k, results)]
+
+    def search(self, query, k=TOP_K, max_distance=MAX_DISTANCE):
+        if query.strip().lstrip("+").replace(" ", "").replace("-", "").isdigit():
+            return self.prefix_phones(query, k)
+        results = self.prefix_names(query, k)
+        if len(results) < k:
+            for name in self.fuzzy_names(query, max_distance, k):
+                if name not in results:
+                    results.append(name)
+        return results[:k]
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
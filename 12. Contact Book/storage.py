@@ -0,0 +1,75 @@
+import os
+import sqlite3
+
+DB_NAME = "contacts.db"
+FILE_NAME = "contact.txt"
+
+
+class ContactStore:
+    def __init__(self, db_name=DB_NAME, legacy_file=FILE_NAME):
+        self._connection = sqlite3.connect(db_name)
+        # NOTE: name is the primary key, so lookups, updates and deletes are B-tree O(log n)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS contacts ("
+                                 "name TEXT PRIMARY KEY, "
+                                 "phone TEXT NOT NULL) WITHOUT ROWID")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID")
+        # NOTE: Whether contact.txt was imported is recorded in meta, an empty table is not a reason
+        # to import it again, the user may simply have deleted every contact
+        if self._meta("legacy_imported") is None:
+            with self._connection:
+                # Databases from before the marker that already hold contacts were imported back then
+                if legacy_file and len(self) == 0 and os.path.exists(legacy_file):
+                    self._import_lines(legacy_file)
+                self._connection.execute("INSERT INTO meta (key, value) VALUES ('legacy_imported', '1')")
+
+    def _meta(self, key):
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _parse_lines(file):
+        for line in file:
+            line = line.strip()
+            if line:
+                # Phone numbers never contain a comma, names might
+                name, _, phone = line.rpartition(",")
+                yield name, phone
+
+    def import_file(self, file_name):
+        with self._connection:
+            self._import_lines(file_name)
+
+    def _import_lines(self, file_name):
+        with open(file_name, "r", encoding="utf-8") as file:
+            self._connection.executemany("INSERT INTO contacts (name, phone) VALUES (?, ?) "
+                                         "ON CONFLICT(name) DO UPDATE SET phone = excluded.phone",
+                                         self._parse_lines(file))
+
+    def load(self):
+        # Rows come back as (name, phone) tuples, dict() builds the contacts straight from the cursor
+        return dict(self._connection.execute("SELECT name, phone FROM contacts"))
+
+    def get(self, name):
+        row = self._connection.execute("SELECT phone FROM contacts WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, name, phone):
+        with self._connection:
+            self._connection.execute("INSERT INTO contacts (name, phone) VALUES (?, ?) "
+                                     "ON CONFLICT(name) DO UPDATE SET phone = excluded.phone", (name, phone))
+
+    def delete(self, name):
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM contacts WHERE name = ?", (name,))
+        return cursor.rowcount > 0
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -0,0 +1,124 @@
+import io
+import random
+import sys
+import time
+import tracemalloc
+
+from hyperloglog import HyperLogLog
+from unique_word import UniqueWord
+from window import UniqueWindow
+
+
+def old_check_duplicate(iterable):
+    if sorted(tuple(set(iterable))) == sorted(tuple(iterable)):
+        return False
+    return True
+
+
+def make_words(count, vocabulary):
+    random.seed(13)
+    return [f"w{random.randrange(vocabulary)}" for _ in range(count)]
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def peak(function, *args):
+    tracemalloc.start()
+    function(*args)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+    # Duplicate check: the old version sorts everything, the new one stops at the first repeat
+    words = [f"w{i}" for i in range(count)]
+    words.insert(10, words[0])
+    print(f"{'Duplicate check':<22} {'Old (sort)':>12} {'New (early exit)':>18}")
+    for label, data in (("repeat near the start", words), ("no repeat", words[11:])):
+        old, old_time = timed(old_check_duplicate, data)
+        new, new_time = timed(UniqueWord.check_duplicate, data)
+        assert old == new
+        print(f"{label:<22} {old_time * 1000:>10.1f}ms {new_time * 1000:>16.3f}ms")
+
+    words = make_words(count, count // 2)
+    text = " ".join(words)
+    exact = len(set(words))
+    print(f"\n{count} words, {exact} distinct")
+
+    result, elapsed = timed(lambda: UniqueWord.count_unique(UniqueWord.words(io.StringIO(text))))
+    memory = peak(lambda stream: UniqueWord.count_unique(UniqueWord.words(stream)), io.StringIO(text))
+    assert result == exact
+    print(f"Exact in memory       : {elapsed:.2f}s, peak {memory / 2**20:.1f} MB")
+
+    limit = exact // 10
+    result, elapsed = timed(lambda: UniqueWord.count_unique(UniqueWord.words(io.StringIO(text)), limit))
+    memory = peak(lambda stream: UniqueWord.count_unique(UniqueWord.words(stream), limit), io.StringIO(text))
+    assert result == exact
+    print(f"Exact, spilled to disk: {elapsed:.2f}s, peak {memory / 2**20:.1f} MB (limit {limit} words)")
+
+    print(f"\n{'Precision':>9} {'Memory':>8} {'Estimate':>9} {'Error':>7} {'Expected':>9} {'Time':>7}")
+    for precision in (10, 12, 14, 16):
+        sketch = HyperLogLog(precision)
+        _, elapsed = timed(sketch.update, UniqueWord.words(io.StringIO(text)))
+        estimate = sketch.count()
+        print(f"{precision:>9} {len(sketch.to_bytes()) / 1024:>6.0f}KB {estimate:>9} "
+              f"{abs(estimate - exact) / exact:>7.2%} {sketch.error():>9.2%} {elapsed:>6.2f}s")
+
+    # Shards counted on their own and merged give exactly the sketch of the whole stream
+    shards = []
+    for start in range(0, count, count // 8):
+        shard = HyperLogLog()
+        shard.update(words[start:start + count // 8])
+        shards.append(HyperLogLog.from_bytes(shard.to_bytes()))
+    whole = HyperLogLog()
+    whole.update(words)
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    assert merged.to_bytes() == whole.to_bytes()
+    print(f"\n{len(shards)} shards merged: {merged.count()}, same registers as one sketch over everything")
+
+    window_benchmark(make_words(min(count, 1_000_000), 20_000))
+
+
+def recount_windows(words, size):
+    # What a window costs without the refcounts: a new set for every position
+    return [len(set(words[max(0, i - size + 1):i + 1])) for i in range(len(words))]
+
+
+def window_benchmark(words):
+    print(f"\nSliding window over {len(words)} words")
+    # The recount column is timed on the first 20,000 words and scaled up
+    print(f"{'Window':>8} {'Recount (scaled)':>18} {'Deque + refcounts':>18} {'Words/s':>12}")
+    for size in (10, 100, 1_000, 10_000, 100_000):
+        start = time.perf_counter()
+        distinct = [value for _, value, _ in UniqueWord.windowed(words, size)]
+        elapsed = time.perf_counter() - start
+
+        # Recounting is O(window) per word, only the smaller windows finish in reasonable time
+        sample = words[:20_000]
+        if size <= 1_000:
+            start = time.perf_counter()
+            assert recount_windows(sample, size) == distinct[:len(sample)]
+            recount = f"{(time.perf_counter() - start) * len(words) / len(sample):>16.2f}s"
+        else:
+            recount = f"{'-':>17}"
+        print(f"{size:>8} {recount} {elapsed:>17.2f}s {len(words) / elapsed:>12,.0f}")
+
+    window = UniqueWindow(1_000)
+    start = time.perf_counter()
+    for word in words:
+        window.add(word)
+    elapsed = time.perf_counter() - start
+    print(f"UniqueWindow.add alone, window 1000: {len(words) / elapsed:,.0f} words/s")
+
+
+if __name__ == "__main__":
+    main()
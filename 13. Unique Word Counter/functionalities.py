@@ -1,4 +1,5 @@
 
+from hyperloglog import HyperLogLog
 from unique_word import UniqueWord
 
 def string_input():
@@ -11,7 +12,7 @@ def string_input():
         print(f"Total Unique Letters: {UniqueWord.count_unique_word(usr_string)}")
 
 def tuple_list():
-    usr_tuple = sorted(tuple(input("Enter the elements separate by space: ").split()))
+    usr_tuple = tuple(input("Enter the elements separate by space: ").split())
 
     if UniqueWord.check_duplicate(usr_tuple):
         print("Tuple Contains Duplicate Elements")
@@ -31,3 +32,49 @@ def list_input():
         return
     else:
         print(f"Total Unique Words: {UniqueWord.count_unique_word(usr_list)}")
+
+
+def file_input():
+    file_name = input("Enter the file name: ")
+    approximate = input("Estimate with HyperLogLog instead of an exact count? (y/n): ").strip().lower() == "y"
+
+    try:
+        with open(file_name, "r", encoding="utf-8", errors="replace") as file:
+            if approximate:
+                sketch = HyperLogLog()
+                sketch.update(UniqueWord.words(file))
+                print(f"About {sketch.count()} Unique Words (typical error {sketch.error():.1%})")
+            else:
+                print(f"Total Unique Words: {UniqueWord.count_unique(UniqueWord.words(file))}")
+    except OSError as error:
+        print(f"Could not read the file: {error}")
+
+
+def window_input():
+    file_name = input("Enter the file name: ")
+    size = int(input("Enter the window size in words: "))
+
+    try:
+        with open(file_name, "r", encoding="utf-8", errors="replace") as file:
+            windows = total = 0
+            highest = lowest = None
+            for position, distinct, _ in UniqueWord.windowed(UniqueWord.words(file), size):
+                if position < size:
+                    continue
+                windows += 1
+                total += distinct
+                if highest is None or distinct > highest[0]:
+                    highest = (distinct, position)
+                if lowest is None or distinct < lowest[0]:
+                    lowest = (distinct, position)
+    except OSError as error:
+        print(f"Could not read the file: {error}")
+        return
+
+    if not windows:
+        print("The file has fewer words than the window size")
+        return
+    print(f"Windows of {size} words: {windows}"
+          f"\nAverage Unique Words: {total / windows:.1f}"
+          f"\nMost Unique Words: {highest[0]} (words {highest[1] - size + 1} to {highest[1]})"
+          f"\nFewest Unique Words: {lowest[0]} (words {lowest[1] - size + 1} to {lowest[1]})")
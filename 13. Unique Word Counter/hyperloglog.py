@@ -0,0 +1,114 @@
+import hashlib
+import math
+from collections import Counter
+from itertools import islice
+
+PRECISION = 14
+BATCH = 64 * 1024
+MAGIC = b"HLL1"
+# 2 ** -rank for every rank a register can hold, so the estimate never calls pow()
+POWERS = [2.0 ** -rank for rank in range(66)]
+
+
+class HyperLogLog:
+    # 2 ** precision one-byte registers. A word's hash picks a register with its first bits,
+    # and the register keeps the longest run of leading zeros seen in the rest. Long runs are
+    # rare, so the runs tell how many different hashes went by. Memory is fixed at 2 ** precision
+    # bytes and the typical error is 1.04 / sqrt(2 ** precision), 0.8% at the default precision.
+    def __init__(self, precision=PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    @staticmethod
+    def _hash(word):
+        # NOTE: blake2b and not hash(), which is salted per run. Sketches built in
+        # different processes or on different machines have to agree to be merged.
+        if isinstance(word, str):
+            word = word.encode("utf-8", "surrogatepass")
+        return int.from_bytes(hashlib.blake2b(word, digest_size=8).digest(), "big")
+
+    def add(self, word):
+        bits = 64 - self.precision
+        value = self._hash(word)
+        index = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def update(self, words):
+        # add() inlined, this is the loop every word of the stream goes through.
+        # Adding a word twice changes nothing, so each batch is deduplicated before hashing.
+        registers = self._registers
+        bits = 64 - self.precision
+        mask = (1 << bits) - 1
+        blake2b = hashlib.blake2b
+        words = iter(words)
+        while batch := set(islice(words, BATCH)):
+            for word in batch:
+                if isinstance(word, str):
+                    word = word.encode("utf-8", "surrogatepass")
+                value = int.from_bytes(blake2b(word, digest_size=8).digest(), "big")
+                index = value >> bits
+                rank = bits - (value & mask).bit_length() + 1
+                if rank > registers[index]:
+                    registers[index] = rank
+
+    def count(self):
+        m = len(self._registers)
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        # Registers only hold 0-65, so summing per distinct value is a few dozen terms
+        total = sum(POWERS[rank] * times for rank, times in Counter(self._registers).items())
+        estimate = alpha * m * m / total
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Few words so far, counting the empty registers is more accurate (linear counting)
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def error(self):
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def merge(self, other):
+        # The union of two streams: the larger register wins. Order and grouping do not
+        # matter, so shards can be counted anywhere and combined afterwards.
+        if other.precision != self.precision:
+            raise ValueError(f"cannot merge precision {other.precision} into precision {self.precision}")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def to_bytes(self):
+        return MAGIC + bytes([self.precision]) + self._registers
+
+    @staticmethod
+    def from_bytes(data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a HyperLogLog sketch")
+        sketch = HyperLogLog(data[len(MAGIC)])
+        registers = data[len(MAGIC) + 1:]
+        if len(registers) != len(sketch._registers):
+            raise ValueError(f"expected {len(sketch._registers)} registers, got {len(registers)}")
+        sketch._registers[:] = registers
+        return sketch
+
+    def save(self, file_name):
+        with open(file_name, "wb") as file:
+            file.write(self.to_bytes())
+
+    @staticmethod
+    def load(file_name):
+        with open(file_name, "rb") as file:
+            return HyperLogLog.from_bytes(file.read())
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -8,6 +8,8 @@ while True:
                    "\n1. Enter List"
                    "\n2. Enter Tuple"
                    "\n3. Enter String"
+                   "\n4. Count Words in a File"
+                   "\n5. Sliding Window over a File"
                    "\n0. Exit"
                    "\nEnter Your Choice: ")
 
@@ -18,10 +20,14 @@ while True:
             func.tuple_list()
         case "3":
             func.string_input()
+        case "4":
+            func.file_input()
+        case "5":
+            func.window_input()
         case "0":
             print("Thank You for using the Application"
                   "\nGoodbye!!!")
             exit()
-        case "_":
+        case _:
             print("Invalid Input"
                   "\nPlease Try Again")
\ No newline at end of file
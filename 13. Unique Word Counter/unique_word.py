@@ -1,3 +1,15 @@
+import os
+import tempfile
+from itertools import chain
+
+from window import WINDOW_SIZE, UniqueWindow
+
+CHUNK_SIZE = 1024 * 1024
+MEMORY_LIMIT = 1_000_000
+PARTITION_BITS = 6
+PARTITIONS = 1 << PARTITION_BITS
+MASK = (1 << 64) - 1
+
 
 class UniqueWord:
     def __init__(self):
@@ -5,12 +17,93 @@ class UniqueWord:
 
     @staticmethod
     def check_duplicate(iterable):
-        if sorted(tuple(set(iterable))) == sorted(tuple(iterable)):
-            return False
-        return True
+        # NOTE: Stops at the first repeated element, the input is never copied or sorted,
+        # so it also works on a generator over a file
+        seen = set()
+        for item in iterable:
+            if item in seen:
+                return True
+            seen.add(item)
+        return False
 
     @staticmethod
     def count_unique_word(iterable):
-        if isinstance(iterable, str):
-            return len(list(iterable))
-        return len(iterable)
+        # Distinct elements, for a string that is distinct letters
+        return len(set(iterable))
+
+    @staticmethod
+    def windowed(words, size=WINDOW_SIZE):
+        # Yields (position, distinct words, has a duplicate) for the last `size` words after every word
+        window = UniqueWindow(size)
+        for position, word in enumerate(words, 1):
+            window.add(word)
+            yield position, window.distinct(), window.has_duplicate()
+
+    @staticmethod
+    def words(stream, chunk_size=CHUNK_SIZE):
+        # Yields the words of a text file a chunk at a time, a word cut by a chunk boundary is carried over
+        carry = ""
+        for chunk in iter(lambda: stream.read(chunk_size), ""):
+            words = (carry + chunk).split()
+            carry = words.pop() if words and not chunk[-1].isspace() else ""
+            yield from words
+        if carry:
+            yield carry
+
+    @staticmethod
+    def count_unique(words, memory_limit=MEMORY_LIMIT, folder=None, level=0):
+        # Exact distinct count of words as split() gives them. Up to memory_limit distinct
+        # words it is a plain set. Past that every word is spilled to one of PARTITIONS files
+        # by its hash, equal words always land in the same file, so the files are counted one
+        # at a time and the counts added up.
+        seen = set()
+        words = iter(words)
+        shift = PARTITION_BITS * level
+        for word in words:
+            seen.add(word)
+            # Past the end of the 64-bit hash every level would split the same way
+            if len(seen) > memory_limit and shift < 64:
+                break
+        else:
+            return len(seen)
+
+        with tempfile.TemporaryDirectory(dir=folder) as temp_folder:
+            files = [open(os.path.join(temp_folder, f"{index}.txt"), "w", encoding="utf-8",
+                          errors="surrogatepass") for index in range(PARTITIONS)]
+            buffers = [[] for _ in range(PARTITIONS)]
+            try:
+                pending = 0
+                for word in chain(seen, words):
+                    # NOTE: Each level takes the next 6 bits of the hash, so a partition that is
+                    # still too big splits differently when it is partitioned again. Salting
+                    # hash() with the level instead gives splits that are strongly correlated.
+                    buffers[(hash(word) & MASK) >> shift & (PARTITIONS - 1)].append(word)
+                    pending += 1
+                    if pending >= memory_limit:
+                        UniqueWord._flush(files, buffers)
+                        pending = 0
+                UniqueWord._flush(files, buffers)
+            finally:
+                for file in files:
+                    file.close()
+            seen = None
+
+            total = 0
+            for index in range(PARTITIONS):
+                with open(os.path.join(temp_folder, f"{index}.txt"), "r", encoding="utf-8",
+                          errors="surrogatepass") as file:
+                    total += UniqueWord.count_unique(UniqueWord.words(file), memory_limit, temp_folder, level + 1)
+            return total
+
+    @staticmethod
+    def _flush(files, buffers):
+        for file, buffer in zip(files, buffers):
+            if buffer:
+                file.write("\n".join(buffer))
+                file.write("\n")
+                buffer.clear()
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -0,0 +1,58 @@
+from collections import deque
+
+WINDOW_SIZE = 1000
+
+
+class UniqueWindow:
+    # The last `size` words of a stream. A deque holds them in order and a dict counts how
+    # often each one is inside, so adding a word and dropping the oldest are both O(1)
+    # and the window is never counted again from scratch.
+    def __init__(self, size=WINDOW_SIZE):
+        if size < 1:
+            raise ValueError(f"window size must be at least 1, got {size}")
+        self.size = size
+        self._words = deque()
+        self._counts = {}
+        # Words that are in the window more than once
+        self._repeated = 0
+
+    def add(self, word):
+        # Returns the word that fell out of the window, or None while it is still filling up
+        counts = self._counts
+        count = counts.get(word, 0) + 1
+        counts[word] = count
+        if count == 2:
+            self._repeated += 1
+        self._words.append(word)
+
+        if len(self._words) <= self.size:
+            return None
+        oldest = self._words.popleft()
+        count = counts[oldest] - 1
+        if count:
+            counts[oldest] = count
+            if count == 1:
+                self._repeated -= 1
+        else:
+            del counts[oldest]
+        return oldest
+
+    def distinct(self):
+        return len(self._counts)
+
+    def has_duplicate(self):
+        return self._repeated > 0
+
+    def repeated(self):
+        return self._repeated
+
+    def count(self, word):
+        return self._counts.get(word, 0)
+
+    def __len__(self):
+        return len(self._words)
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -0,0 +1,78 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from cursor import StudentCursor
+from storage import DATA_MAGIC, StudentStorage
+
+CITIES = ["Dhaka", "Gazipur", "Sherpur", "Kaligonj", "Uttara", "Khulna", "Sylhet", "Rajshahi"]
+
+
+def write_data_file(file_name, count):
+    random.seed(1)
+    with open(file_name, "wb") as file:
+        file.write(DATA_MAGIC)
+        for i in range(count):
+            file.write(StudentStorage._pack(f"Student {i}", random.randint(12, 30),
+                                            random.choice("ABCDEF"), random.choice(CITIES)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as folder:
+        data_file = os.path.join(folder, "student.dat")
+        index_file = os.path.join(folder, "student.idx")
+        write_data_file(data_file, count)
+
+        start = time.perf_counter()
+        storage = StudentStorage(data_file, index_file, None)
+        print(f"Students: {len(storage)}")
+        print(f"First open (builds the index): {time.perf_counter() - start:.2f}s")
+        storage.close()
+
+        start = time.perf_counter()
+        storage = StudentStorage(data_file, index_file, None)
+        print(f"Open with persisted index    : {(time.perf_counter() - start) * 1000:.2f}ms")
+
+        names = [f"Student {random.randrange(count)}" for _ in range(10_000)]
+        start = time.perf_counter()
+        for name in names:
+            storage.get(name)
+        print(f"Lookup by name               : {(time.perf_counter() - start) / len(names) * 1e6:.1f}us")
+
+        cursor = StudentCursor(storage)
+        start = time.perf_counter()
+        cursor.page(0)
+        print(f"First page                   : {(time.perf_counter() - start) * 1000:.2f}ms")
+        last = cursor.page_count() - 1
+        start = time.perf_counter()
+        cursor.page(last)
+        print(f"Seek to last page (cold)     : {(time.perf_counter() - start) * 1000:.2f}ms")
+        pages = [random.randrange(last + 1) for _ in range(1000)]
+        start = time.perf_counter()
+        for number in pages:
+            cursor.page(number)
+        print(f"Random page (offset index)   : {(time.perf_counter() - start) / len(pages) * 1e6:.1f}us")
+
+        start = time.perf_counter()
+        for name in names[:1000]:
+            storage.delete(name)
+        print(f"Delete (tombstone)           : {(time.perf_counter() - start) / 1000 * 1e6:.1f}us")
+
+        start = time.perf_counter()
+        for i in range(1000):
+            storage.add(f"New Student {i}", 20, "A", "Dhaka")
+        print(f"Add (append)                 : {(time.perf_counter() - start) / 1000 * 1e6:.1f}us")
+
+        start = time.perf_counter()
+        storage.compact()
+        print(f"Compaction                   : {time.perf_counter() - start:.2f}s")
+        print(f"Data file: {os.path.getsize(data_file) / 2**20:.1f} MB, "
+              f"index: {os.path.getsize(index_file) / 2**20:.1f} MB")
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from itertools import islice
+
+PAGE_SIZE = 10
+
+
+class StudentCursor:
+    def __init__(self, storage, page_size=PAGE_SIZE):
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1")
+        self._storage = storage
+        self.page_size = page_size
+        self._reset()
+
+    def _reset(self):
+        # _page_starts[n] is the file offset of the first record on page n
+        self._page_starts = []
+        self._generation = self._storage.generation
+
+    def page_count(self):
+        return max(1, -(-len(self._storage) // self.page_size))
+
+    def _seek(self, number):
+        if self._generation != self._storage.generation:
+            self._reset()
+        starts = self._page_starts
+        if number < len(starts):
+            return starts[number]
+
+        # NOTE: The offset index only grows as far as the furthest page asked for,
+        # continuing from the last page start it already knows
+        for count, offset in enumerate(self._storage.offsets(starts[-1] if starts else None)):
+            if count % self.page_size:
+                continue
+            if count or not starts:
+                starts.append(offset)
+            if number < len(starts):
+                return offset
+        return None
+
+    def page(self, number):
+        if number < 0:
+            raise ValueError("Page number cannot be negative")
+        start = self._seek(number)
+        if start is None:
+            return []
+        return [self._storage.record_at(offset)
+                for offset in islice(self._storage.offsets(start), self.page_size)]
+
+    def __iter__(self):
+        number = 0
+        while page := self.page(number):
+            yield page
+            number += 1
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -1,64 +1,99 @@
+from cursor import PAGE_SIZE, StudentCursor
 from student import *
 from utils import *
 
-def store_in_dict():
-    student_dict = {}
-    with open(FILE_NAME, "r") as file:
-        lines = file.readlines()
-        for line in lines:
-            line = line.split(",")
-            student_dict[line[0]] = (line[1], line[2], line[3])
-    return student_dict
-
-def add_student():
-    show_dict = {}
+def add_student(storage):
     name = input("Enter name: ")
     age = int(input("Enter age: "))
     grade = input("Enter grade: ")
     city = input("Enter city: ")
 
     try:
-        Student(name, age, grade, city)
-        show_dict[name] = (age, grade, city)
+        Student(name, age, grade, city, storage)
     except ValueError as e:
-        raise e
+        # Bad age or grade, or a field too long to store, nothing was saved
+        print(e)
+        return
     except TypeError as e:
         raise e
     except Exception as e:
         raise e
     else:
         print("Student added successfully")
-    return show_dict
 
-def search_student():
+def search_student(storage):
     name = input("Enter name: ")
-    with open(FILE_NAME, "r") as file:
-        lines = file.readlines()
-        for line in lines:
-            if name in line:
-                line = line.split(",")
-                print(f"\nName: {line[0]}"
-                      f"\nAge: {line[1]}"
-                      f"\nGrade: {line[2]}"
-                      f"\nCity: {line[3]}"
-                      f"\n")
+    student = storage.get(name)
+    if student is None:
+        print("Student not found")
+        return
+    name, age, grade, city = student
+    print(f"\nName: {name}"
+          f"\nAge: {age}"
+          f"\nGrade: {grade}"
+          f"\nCity: {city}"
+          f"\n")
 
-def delete_students():
+def delete_students(storage):
     name = input("Enter Name: ")
-    with open(FILE_NAME, "r") as file:
-        lines = file.readlines()
-    with open(FILE_NAME, "w") as file:
-        for line in lines:
-            if name not in line:
-                file.write(line)
-    print("Student deleted successfully")
+    if storage.delete(name):
+        print("Student deleted successfully")
+    else:
+        print("Student not found")
+
+def query_students(query):
+    min_age = input("Minimum age (blank for any): ")
+    max_age = input("Maximum age (blank for any): ")
+    city = input("City (blank for any): ")
+    grade = input("Grade (blank for any): ")
+    filters = {
+        "min_age": int(min_age) if min_age else None,
+        "max_age": int(max_age) if max_age else None,
+        "city": city or None,
+        "grade": grade or None,
+    }
+
+    estimate, index = query.plan(**filters)
+    results = query.find(**filters)
+    print(f"\nUsing {index} index ({estimate} candidates), {len(results)} students found\n")
+    for name, age, grade, city in results:
+        print(f"{name}, {age}, {grade}, {city}")
+
+def import_students(importer):
+    csv_file = input("CSV file (name,age,grade,city): ")
+    reject_file = input("Reject report file (blank for rejects.csv): ") or "rejects.csv"
+    try:
+        accepted, rejected, seconds = importer.run(csv_file, reject_file)
+    except OSError as e:
+        # Missing or unreadable file, nothing was imported
+        print(e)
+        return
+    print(f"\nImported {accepted} students, rejected {rejected} in {seconds:.2f}s")
+    if rejected:
+        print(f"Rejected rows and reasons written to {reject_file}")
+
+def view_students(storage):
+    page_size = input(f"Students per page (blank for {PAGE_SIZE}): ")
+    cursor = StudentCursor(storage, int(page_size) if page_size else PAGE_SIZE)
+    number = 0
+    while True:
+        page = cursor.page(number)
+        count = number * cursor.page_size + 1
+        for name, age, grade, city in page:
+            beautify(f"Student {count}")
+            print(f"\nName: {name}")
+            print(f"Age: {age}")
+            print(f"Grade: {grade}")
+            print(f"City: {city}\n")
+            count += 1
 
-def view_students(student_dict):
-    count = 1
-    for key, value in student_dict.items():
-        beautify(f"Student {count}")
-        print(f"\nName: {key}")
-        print(f"Age: {value[0]}")
-        print(f"Grade: {value[1]}")
-        print(f"City: {value[2]}\n")
-        count += 1
\ No newline at end of file
+        choice = input(f"Page {number + 1} of {cursor.page_count()}. "
+                       f"[n]ext, [p]revious, page number or [q]uit: ").strip().casefold()
+        if choice == "n":
+            number = min(number + 1, cursor.page_count() - 1)
+        elif choice == "p":
+            number = max(number - 1, 0)
+        elif choice.isdigit():
+            number = min(max(int(choice) - 1, 0), cursor.page_count() - 1)
+        else:
+            break
@@ -0,0 +1,84 @@
+import csv
+import os
+import time
+from itertools import islice
+
+from storage import StudentStorage
+from student import Student
+
+BATCH_SIZE = 10_000
+WRITE_BUFFER = 1024 * 1024
+HEADER = ["name", "age", "grade", "city"]
+
+
+class BulkImporter:
+    def __init__(self, storage, batch_size=BATCH_SIZE):
+        self._storage = storage
+        self._batch_size = batch_size
+
+    @staticmethod
+    def _validate(row):
+        if len(row) != 4:
+            raise ValueError(f"Expected 4 fields (name, age, grade, city), got {len(row)}")
+        name, age, grade, city = (field.strip() for field in row)
+        if not name:
+            raise ValueError("Name cannot be empty")
+        age = Student._age_verify(int(age))
+        grade = Student._grade_verify(grade)
+        return name, age, grade, city
+
+    @staticmethod
+    def _numbered(reader):
+        # (line, row) with the physical line each row starts on, a quoted field may span several lines
+        line = 1
+        for row in reader:
+            yield line, row
+            line = reader.line_num + 1
+
+    def _check_batch(self, batch):
+        # Accepted rows come back packed, a row too long for a record is rejected like any other bad row
+        accepted = []
+        rejected = []
+        for line_number, row in batch:
+            try:
+                accepted.append(StudentStorage._pack(*self._validate(row)))
+            except ValueError as e:
+                rejected.append((line_number, row, str(e)))
+        return accepted, rejected
+
+    def run(self, csv_file, reject_file="rejects.csv"):
+        accepted = rejected = 0
+        start = time.perf_counter()
+        temp_name = self._storage.bulk_writer()
+        try:
+            with (open(csv_file, "r", encoding="utf-8", newline="") as source,
+                  open(temp_name, "ab", buffering=WRITE_BUFFER) as data,
+                  open(reject_file, "w", encoding="utf-8", newline="") as rejects):
+                reject_writer = csv.writer(rejects)
+                reject_writer.writerow(["line", "reason", "row"])
+                rows = self._numbered(csv.reader(source))
+                while True:
+                    batch = list(islice(rows, self._batch_size))
+                    if not batch:
+                        break
+                    if batch[0][0] == 1 and [field.strip().casefold() for field in batch[0][1]] == HEADER:
+                        batch = batch[1:]
+
+                    good, bad = self._check_batch(batch)
+                    # One write per batch instead of one open/append/close per student
+                    data.write(b"".join(good))
+                    reject_writer.writerows((line, reason, ",".join(row)) for line, row, reason in bad)
+                    accepted += len(good)
+                    rejected += len(bad)
+        except BaseException:
+            os.remove(temp_name)
+            raise
+
+        # NOTE: The new file only replaces the live one here, an import that fails halfway changes nothing
+        self._storage.commit_bulk(temp_name)
+        return accepted, rejected, time.perf_counter() - start
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
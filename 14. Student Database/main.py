@@ -1,8 +1,14 @@
 from utils import *
 from functionalities import *
+from importer import BulkImporter
+from query import StudentQuery
+from storage import StudentStorage
 
-student_dict = store_in_dict()
-show_dict = student_dict.copy()
+storage = StudentStorage()
+for line_number, line, reason in storage.legacy_rejects:
+    print(f"Not imported from student.txt, line {line_number} ({reason}): {line}")
+query = StudentQuery(storage)
+importer = BulkImporter(storage)
 
 while True:
     beautify("Student Database")
@@ -12,19 +18,26 @@ while True:
                        "\n2. Search Student"
                        "\n3. Delete Student"
                        "\n4. List All Students"
+                       "\n5. Query Students"
+                       "\n6. Bulk Import CSV"
                        "\n0. Exit"
                        "\n\nEnter your choice: ")
 
     match choice:
         case "1":
-            show_dict.update(add_student())
+            add_student(storage)
         case "2":
-            search_student()
+            search_student(storage)
         case "3":
-            delete_students()
+            delete_students(storage)
         case "4":
-            view_students(show_dict)
+            view_students(storage)
+        case "5":
+            query_students(query)
+        case "6":
+            import_students(importer)
         case "0":
+            storage.close()
             print("Thank You for Using the Application"
                   "\nGoodbye!!!")
             exit()
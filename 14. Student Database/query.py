@@ -0,0 +1,109 @@
+import bisect
+
+LAST_NAME = chr(0x10FFFF)
+
+
+class StudentQuery:
+    def __init__(self, storage):
+        self._storage = storage
+        self._ages = []
+        self._cities = {}
+        self._grades = {}
+        self._built = False
+        storage.add_listener(self)
+
+    def _build(self):
+        # NOTE: Built on the first query, so opening the database stays instant
+        records = list(self._storage)
+        self._ages = sorted((age, name) for name, age, _, _ in records)
+        for name, _, grade, city in records:
+            self._cities.setdefault(city.casefold(), set()).add(name)
+            self._grades.setdefault(grade.casefold(), set()).add(name)
+        self._built = True
+
+    def reloaded(self):
+        self._ages = []
+        self._cities = {}
+        self._grades = {}
+        self._built = False
+
+    def added(self, record, old_record):
+        if not self._built:
+            return
+        if old_record is not None:
+            self.deleted(old_record)
+        name, age, grade, city = record
+        bisect.insort(self._ages, (age, name))
+        self._cities.setdefault(city.casefold(), set()).add(name)
+        self._grades.setdefault(grade.casefold(), set()).add(name)
+
+    def deleted(self, record):
+        if not self._built:
+            return
+        name, age, grade, city = record
+        position = bisect.bisect_left(self._ages, (age, name))
+        if position < len(self._ages) and self._ages[position] == (age, name):
+            self._ages.pop(position)
+        for index, key in ((self._cities, city.casefold()), (self._grades, grade.casefold())):
+            names = index.get(key)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del index[key]
+
+    def _age_range(self, min_age, max_age):
+        low = 0 if min_age is None else bisect.bisect_left(self._ages, (min_age,))
+        high = len(self._ages) if max_age is None else bisect.bisect_right(self._ages, (max_age, LAST_NAME))
+        return low, high
+
+    def plan(self, min_age=None, max_age=None, city=None, grade=None):
+        if not self._built:
+            self._build()
+        # Each usable index reports how many candidates it would produce, the smallest one wins
+        plans = []
+        if min_age is not None or max_age is not None:
+            low, high = self._age_range(min_age, max_age)
+            plans.append((high - low, "age"))
+        if city is not None:
+            plans.append((len(self._cities.get(city.casefold(), ())), "city"))
+        if grade is not None:
+            plans.append((len(self._grades.get(grade.casefold(), ())), "grade"))
+        if not plans:
+            return len(self._storage), "scan"
+        return min(plans)
+
+    def find(self, min_age=None, max_age=None, city=None, grade=None):
+        _, index = self.plan(min_age, max_age, city, grade)
+        if index == "age":
+            low, high = self._age_range(min_age, max_age)
+            names = (name for _, name in self._ages[low:high])
+        elif index == "city":
+            names = self._cities.get(city.casefold(), ())
+        elif index == "grade":
+            names = self._grades.get(grade.casefold(), ())
+        else:
+            return list(self._storage)
+
+        results = []
+        for name in names:
+            record = self._storage.get(name)
+            if record is None:
+                continue
+            _, age, record_grade, record_city = record
+            if min_age is not None and age < min_age:
+                continue
+            if max_age is not None and age > max_age:
+                continue
+            if city is not None and record_city.casefold() != city.casefold():
+                continue
+            if grade is not None and record_grade.casefold() != grade.casefold():
+                continue
+            results.append(record)
+        if index != "age":
+            results.sort()
+        return results
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
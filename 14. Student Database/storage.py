@@ -0,0 +1,347 @@
+import hashlib
+import mmap
+import os
+import struct
+
+DATA_FILE = "student.dat"
+INDEX_FILE = "student.idx"
+LEGACY_FILE = "student.txt"
+
+DATA_MAGIC = b"STUDAT01"
+INDEX_MAGIC = b"STUIDX01"
+# status, age, name length, grade length, city length, then the three UTF-8 strings
+RECORD = struct.Struct("<BHHBH")
+# Largest age and field lengths in bytes the record header can hold
+MAX_AGE = 0xFFFF
+MAX_LENGTHS = (("Name", 0xFFFF), ("Grade", 0xFF), ("City", 0xFFFF))
+# magic, slot count, used slots, data file size, live records, dead bytes
+INDEX_HEADER = struct.Struct("<8sQQQQQ")
+# name hash, record offset (0 = empty slot)
+SLOT = struct.Struct("<QQ")
+
+LIVE = 1
+DELETED = 0
+TOMBSTONE = 2**64 - 1
+MIN_SLOTS = 1024
+MAX_LOAD = 0.7
+COMPACT_MIN_BYTES = 1024 * 1024
+COMPACT_RATIO = 0.5
+
+
+class StudentStorage:
+    def __init__(self, data_file=DATA_FILE, index_file=INDEX_FILE, legacy_file=LEGACY_FILE):
+        self._data_file = data_file
+        self._index_file = index_file
+        self._listeners = []
+        # Bumped whenever existing record offsets stop being valid, so cursors know to drop theirs
+        self.generation = 0
+        # Lines of the legacy file that could not be imported, as (line number, line, reason)
+        self.legacy_rejects = []
+        if not os.path.exists(data_file):
+            # NOTE: A new data file is built under a temporary name and only renamed into place once
+            # the legacy import is done, so a first start that fails simply starts over next time
+            temp_name = data_file + ".import"
+            try:
+                with open(temp_name, "wb") as file:
+                    file.write(DATA_MAGIC)
+                    if legacy_file and os.path.exists(legacy_file):
+                        self.legacy_rejects = self.import_text(legacy_file, file)
+            except BaseException:
+                os.remove(temp_name)
+                raise
+            if os.path.exists(index_file):
+                os.remove(index_file)
+            os.replace(temp_name, data_file)
+        self._open_data()
+        self._open_index()
+
+    def _open_data(self):
+        self._data = open(self._data_file, "r+b")
+        self._data_map = mmap.mmap(self._data.fileno(), 0)
+        if self._data_map[:len(DATA_MAGIC)] != DATA_MAGIC:
+            self.close()
+            raise ValueError(f"{self._data_file} is not a student data file")
+
+    def _open_index(self):
+        data_size = os.path.getsize(self._data_file)
+        if os.path.exists(self._index_file):
+            self._index = open(self._index_file, "r+b")
+            self._index_map = mmap.mmap(self._index.fileno(), 0)
+            magic, self._slots, self._used, indexed_size, self._live, self._dead = \
+                INDEX_HEADER.unpack_from(self._index_map)
+            # NOTE: A crash between writing the data and the index leaves them out of step, rebuild then
+            if magic == INDEX_MAGIC and indexed_size == data_size:
+                return
+            self._index_map.close()
+            self._index.close()
+        self._rebuild_index()
+
+    def _create_index(self, file_name, slots):
+        with open(file_name, "wb") as file:
+            file.truncate(INDEX_HEADER.size + slots * SLOT.size)
+        self._index = open(file_name, "r+b")
+        self._index_map = mmap.mmap(self._index.fileno(), 0)
+        self._slots = slots
+        self._used = self._live = self._dead = 0
+
+    def _rebuild_index(self, slots=None):
+        live = [(name, offset) for offset, name in self._scan_names()]
+        if slots is None:
+            slots = MIN_SLOTS
+            while len(live) > slots * MAX_LOAD:
+                slots *= 2
+        dead = len(self._data_map) - len(DATA_MAGIC) - sum(self._record_size(offset) for _, offset in live)
+
+        temp_name = self._index_file + ".tmp"
+        self._create_index(temp_name, slots)
+        for name, offset in live:
+            self._insert_slot(self._hash(name), name, offset)
+        self._dead = dead
+        self._write_header()
+        self._index_map.flush()
+        self._index_map.close()
+        self._index.close()
+        os.replace(temp_name, self._index_file)
+        self._index = open(self._index_file, "r+b")
+        self._index_map = mmap.mmap(self._index.fileno(), 0)
+
+    def _write_header(self):
+        INDEX_HEADER.pack_into(self._index_map, 0, INDEX_MAGIC, self._slots, self._used,
+                               len(self._data_map), self._live, self._dead)
+
+    def _remap_data(self):
+        self._data_map.close()
+        self._data_map = mmap.mmap(self._data.fileno(), 0)
+
+    @staticmethod
+    def _hash(name):
+        return int.from_bytes(hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest(), "little")
+
+    @staticmethod
+    def _pack(name, age, grade, city, status=LIVE):
+        # Raises ValueError for a student that does not fit in a record, before anything is written
+        age = int(age)
+        if not 0 <= age <= MAX_AGE:
+            raise ValueError(f"Age must be between 0 and {MAX_AGE} to be stored")
+        fields = name.encode("utf-8"), grade.encode("utf-8"), city.encode("utf-8")
+        for field, (label, limit) in zip(fields, MAX_LENGTHS):
+            if len(field) > limit:
+                raise ValueError(f"{label} is {len(field)} bytes, at most {limit} can be stored")
+        name, grade, city = fields
+        return RECORD.pack(status, age, len(name), len(grade), len(city)) + name + grade + city
+
+    def _record_size(self, offset):
+        _, _, name_len, grade_len, city_len = RECORD.unpack_from(self._data_map, offset)
+        return RECORD.size + name_len + grade_len + city_len
+
+    def _read_name(self, offset):
+        status, _, name_len, _, _ = RECORD.unpack_from(self._data_map, offset)
+        start = offset + RECORD.size
+        return status, self._data_map[start:start + name_len].decode("utf-8")
+
+    def _read(self, offset):
+        status, age, name_len, grade_len, city_len = RECORD.unpack_from(self._data_map, offset)
+        start = offset + RECORD.size
+        name = self._data_map[start:start + name_len].decode("utf-8")
+        start += name_len
+        grade = self._data_map[start:start + grade_len].decode("utf-8")
+        start += grade_len
+        city = self._data_map[start:start + city_len].decode("utf-8")
+        return status, (name, age, grade, city)
+
+    def _scan(self, offset=len(DATA_MAGIC)):
+        end = len(self._data_map)
+        while offset + RECORD.size <= end:
+            size = self._record_size(offset)
+            if offset + size > end:
+                break
+            yield offset, size
+            offset += size
+
+    def _scan_names(self):
+        # Later records win: a name written twice (bulk import, or a crash mid-update) keeps its newest copy
+        latest = {}
+        for offset, _ in self._scan():
+            status, name = self._read_name(offset)
+            if status == LIVE:
+                if name in latest:
+                    self._data_map[latest[name]] = DELETED
+                latest[name] = offset
+        return [(offset, name) for name, offset in latest.items()]
+
+    def _slot(self, position):
+        return SLOT.unpack_from(self._index_map, INDEX_HEADER.size + position * SLOT.size)
+
+    def _set_slot(self, position, name_hash, offset):
+        SLOT.pack_into(self._index_map, INDEX_HEADER.size + position * SLOT.size, name_hash, offset)
+
+    def _find(self, name_hash, name):
+        mask = self._slots - 1
+        position = name_hash & mask
+        free = None
+        while True:
+            slot_hash, offset = self._slot(position)
+            if offset == 0:
+                return None, position if free is None else free
+            if offset == TOMBSTONE:
+                if free is None:
+                    free = position
+            elif slot_hash == name_hash and self._read_name(offset)[1] == name:
+                return position, None
+            position = (position + 1) & mask
+
+    def _insert_slot(self, name_hash, name, offset):
+        found, free = self._find(name_hash, name)
+        if found is not None:
+            self._set_slot(found, name_hash, offset)
+            return
+        if self._slot(free)[1] == 0:
+            self._used += 1
+        self._set_slot(free, name_hash, offset)
+        self._live += 1
+
+    def get(self, name):
+        found, _ = self._find(self._hash(name), name)
+        if found is None:
+            return None
+        status, record = self._read(self._slot(found)[1])
+        return record if status == LIVE else None
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def add_listener(self, listener):
+        # Listeners get added(record, old_record) and deleted(record) after every change,
+        # and reloaded() after a bulk import replaced the data file
+        self._listeners.append(listener)
+
+    def add(self, name, age, grade, city):
+        # Packed first, so a student that does not fit raises ValueError and changes nothing
+        record = self._pack(name, age, grade, city)
+        name_hash = self._hash(name)
+        found, _ = self._find(name_hash, name)
+        old_record = None
+        if found is not None:
+            # NOTE: Updates append a new record and tombstone the old one, records never move
+            old_offset = self._slot(found)[1]
+            old_record = self._read(old_offset)[1]
+            self._data_map[old_offset] = DELETED
+            self._dead += self._record_size(old_offset)
+            self.generation += 1
+
+        self._data.seek(0, os.SEEK_END)
+        offset = self._data.tell()
+        self._data.write(record)
+        self._data.flush()
+        self._remap_data()
+
+        if (self._used + 1) > self._slots * MAX_LOAD:
+            self._rebuild_index(self._slots * 2)
+        else:
+            self._insert_slot(name_hash, name, offset)
+            self._write_header()
+        for listener in self._listeners:
+            listener.added((name, int(age), grade, city), old_record)
+        if old_record is not None:
+            self._maybe_compact()
+
+    def delete(self, name):
+        found, _ = self._find(self._hash(name), name)
+        if found is None:
+            return False
+        offset = self._slot(found)[1]
+        record = self._read(offset)[1]
+        self._data_map[offset] = DELETED
+        self._set_slot(found, 0, TOMBSTONE)
+        self._dead += self._record_size(offset)
+        self._live -= 1
+        self.generation += 1
+        self._write_header()
+        for listener in self._listeners:
+            listener.deleted(record)
+        self._maybe_compact()
+        return True
+
+    def _maybe_compact(self):
+        # Updates leave dead records behind just like deletes, both check here
+        if self._dead > COMPACT_MIN_BYTES and self._dead > len(self._data_map) * COMPACT_RATIO:
+            self.compact()
+
+    def __iter__(self):
+        for offset, _ in self._scan():
+            status, record = self._read(offset)
+            if status == LIVE:
+                yield record
+
+    def __len__(self):
+        return self._live
+
+    def offsets(self, start=None):
+        # Only the status byte is read, records are decoded later by record_at()
+        for offset, _ in self._scan(start or len(DATA_MAGIC)):
+            if self._data_map[offset] == LIVE:
+                yield offset
+
+    def record_at(self, offset):
+        return self._read(offset)[1]
+
+    def compact(self):
+        temp_name = self._data_file + ".tmp"
+        with open(temp_name, "wb") as file:
+            file.write(DATA_MAGIC)
+            for offset, size in self._scan():
+                if self._data_map[offset] == LIVE:
+                    file.write(self._data_map[offset:offset + size])
+        self._swap_data(temp_name)
+
+    def _swap_data(self, temp_name):
+        self.generation += 1
+        self._data_map.close()
+        self._data.close()
+        os.replace(temp_name, self._data_file)
+        self._open_data()
+        self._index_map.close()
+        self._index.close()
+        self._rebuild_index()
+
+    def bulk_writer(self):
+        # NOTE: Bulk writes go to a copy of the data file, the live file is only swapped in by commit_bulk()
+        temp_name = self._data_file + ".import"
+        with open(temp_name, "wb") as file:
+            file.write(self._data_map)
+        return temp_name
+
+    def commit_bulk(self, temp_name):
+        self._swap_data(temp_name)
+        for listener in self._listeners:
+            listener.reloaded()
+
+    @staticmethod
+    def import_text(file_name, data):
+        # Packs the old name,age,grade,city lines into an open data file, returns the lines it could not read
+        rejected = []
+        with open(file_name, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, 1):
+                line = line.rstrip("\n")
+                if not line.strip():
+                    continue
+                # Split from the right, the old add_student let names contain commas
+                fields = line.rsplit(",", 3)
+                try:
+                    if len(fields) != 4:
+                        raise ValueError(f"Expected 4 fields (name, age, grade, city), got {len(fields)}")
+                    name, age, grade, city = fields
+                    data.write(StudentStorage._pack(name, int(age), grade, city))
+                except ValueError as e:
+                    rejected.append((line_number, line, str(e)))
+        return rejected
+
+    def close(self):
+        for handle in ("_data_map", "_data", "_index_map", "_index"):
+            if hasattr(self, handle):
+                getattr(self, handle).close()
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -1,13 +1,11 @@
-FILE_NAME = "student.txt"
-
-
 class Student:
-    def __init__(self, name, age, grade, city):
+    def __init__(self, name, age, grade, city, storage=None):
         self._name = name
         self._age = self._age_verify(age)
         self._grade = self._grade_verify(grade)
         self._city = city
-        self._save_on_file()
+        if storage is not None:
+            self._save(storage)
 
     @staticmethod
     def _age_verify(age):
@@ -23,6 +21,8 @@ class Student:
         else:
             raise ValueError("Grade must be between A and F")
 
-    def _save_on_file(self):
-        with open(FILE_NAME, "a") as file:
-            file.write(f"{self._name},{self._age},{self._grade},{self._city}\n")
+    def record(self):
+        return self._name, self._age, self._grade, self._city
+
+    def _save(self, storage):
+        storage.add(*self.record())
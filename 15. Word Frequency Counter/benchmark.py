@@ -0,0 +1,127 @@
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from counter import Count
+from index import WordIndex
+from sketch import ApproximateCount
+
+
+def old_count_words(string):
+    count_dict = {}
+    temp_string = tuple(string.split())
+    for word in temp_string:
+        count_dict[word] = temp_string.count(word)
+    return count_dict
+
+
+def make_text(words, alpha=1.0):
+    random.seed(5)
+    # Zipf-like: a few words are very common and there is a long tail of rare ones.
+    # A smaller alpha makes the tail longer, so the vocabulary gets huge.
+    return " ".join(f"w{int(random.paretovariate(alpha))}" for _ in range(words))
+
+
+def measure(function, text, *args):
+    start = time.perf_counter()
+    result = function(io.StringIO(text), *args)
+    elapsed = time.perf_counter() - start
+    # Timed without tracemalloc, it slows Python code down several times
+    stream = io.StringIO(text)
+    tracemalloc.start()
+    function(stream, *args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    words = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000_000
+    print(f"{'Words':>8} {'Old (tuple.count)':>18} {'New (one pass)':>15}")
+    for size in (1_000, 4_000, 16_000):
+        text = make_text(size)
+        start = time.perf_counter()
+        old = old_count_words(text)
+        old_time = time.perf_counter() - start
+        start = time.perf_counter()
+        new = Count.count_words(text)
+        new_time = time.perf_counter() - start
+        assert old == new
+        print(f"{size:>8} {old_time * 1000:>16.1f}ms {new_time * 1000:>13.2f}ms")
+
+    text = make_text(words, 0.1) + "\n"
+    exact, exact_time, exact_peak = measure(Count.count_stream, text)
+    approximate, approximate_time, approximate_peak = measure(
+        ApproximateCount.count_stream, text, False, 256 * 1024, 1 << 18, 4, 1000)
+    print(f"\n{words} words, {len(exact)} distinct")
+    print(f"Exact        : {exact_time:.2f}s, peak {exact_peak / 2**20:.1f} MB")
+    print(f"Approximate  : {approximate_time:.2f}s, peak {approximate_peak / 2**20:.1f} MB "
+          f"(sketch {approximate.sketch.memory() / 2**20:.1f} MB)")
+
+    exact_top = Count.top_k(exact, 10)
+    approximate_top = approximate.top_k(10)
+    overlap = len({word for word, _ in exact_top} & {word for word, _ in approximate_top})
+    error = max(approximate[word] - count for word, count in exact_top)
+    print(f"Top 10 overlap: {overlap}/10, largest overestimate in the top 10: {error}")
+    assert all(approximate[word] >= count for word, count in exact.items())
+
+    parallel_benchmark(exact, text)
+
+
+def parallel_benchmark(exact, text):
+    # The same text as 2,000 small files plus one big file, 3 copies of the text in total
+    words = text.split(" ")
+    with tempfile.TemporaryDirectory() as folder:
+        step = len(words) // 2000 + 1
+        for i in range(0, len(words), step):
+            with open(os.path.join(folder, f"part{i // step:04}.txt"), "w") as file:
+                file.write(" ".join(words[i:i + step]))
+        with open(os.path.join(folder, "big.txt"), "w") as file:
+            file.write(text)
+            file.write(text)
+
+        print(f"\nMap-reduce over {len(os.listdir(folder))} files, {os.cpu_count()} CPUs")
+        baseline = None
+        for workers in sorted({1, 2, 4, os.cpu_count()}):
+            start = time.perf_counter()
+            counts = Count.count_parallel([folder], workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            assert all(counts[word] == 3 * count for word, count in exact.items())
+            print(f"{workers:>3} workers : {elapsed:.2f}s ({baseline / elapsed:.1f}x)")
+
+        with tempfile.TemporaryDirectory() as index_folder:
+            index_benchmark(folder, os.path.join(index_folder, "words.db"), exact)
+
+
+def index_benchmark(folder, db_name, exact):
+    word = Count.top_k(exact, 1)[0][0]
+    index = WordIndex(db_name)
+    print(f"\nInverted index over the same files")
+    for label in ("First build", "Nothing changed"):
+        start = time.perf_counter()
+        index.update([folder])
+        print(f"{label:<22}: {time.perf_counter() - start:.2f}s")
+
+    with open(os.path.join(folder, "part0000.txt"), "a") as file:
+        file.write(f" {word}")
+    start = time.perf_counter()
+    indexed, _, _ = index.update([folder])
+    print(f"One file changed      : {time.perf_counter() - start:.2f}s ({indexed} reindexed)")
+
+    start = time.perf_counter()
+    count = Count.count_parallel([folder], 1)[word]
+    print(f"Recount for one word  : {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    assert index.count(word) == count == 3 * exact[word] + 1
+    index.top_k(10)
+    print(f"Index word and top 10 : {(time.perf_counter() - start) * 1000:.2f}ms")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,202 @@
+import codecs
+import heapq
+import os
+import re
+import string as characters
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from operator import itemgetter
+
+CHUNK_SIZE = 1024 * 1024
+TOP_K = 10
+TASK_SIZE = 8 * 1024 * 1024
+WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+PUNCTUATION = characters.punctuation + "“”‘’—–…"
+# The last whitespace character of a string, \s matches exactly what str.isspace() and str.split() do
+LAST_SPACE = re.compile(r"\s\S*\Z")
+
 
 class Count:
     def __init__(self):
         pass
 
     @staticmethod
-    def count_words(string):
-        count_dict = {}
-        temp_string = tuple(string.split())
-        for word in temp_string:
-            count_dict[word] = temp_string.count(word)
-        print(count_dict)
+    def tokens(text, normalize=False):
+        # NOTE: By default a word is anything between whitespace, exactly like before.
+        # normalize=True also ignores case and strips punctuation around words.
+        words = text.split()
+        if normalize:
+            words = [word for word in (word.strip(PUNCTUATION).casefold() for word in words) if word]
+        return words
+
+    @staticmethod
+    def count_words(string, normalize=False):
+        # One pass with a hash map instead of tuple.count() for every word
+        return Counter(Count.tokens(string, normalize))
+
+    @staticmethod
+    def chunks(stream, chunk_size=CHUNK_SIZE):
+        return Count._whole_words(iter(lambda: stream.read(chunk_size), ""))
+
+    @staticmethod
+    def _whole_words(pieces):
+        # Yields the text again in pieces that never end in the middle of a word
+        carry = ""
+        for chunk in pieces:
+            if not chunk:
+                continue
+            chunk = carry + chunk
+            if chunk[-1].isspace():
+                carry = ""
+            else:
+                cut = max(chunk.rfind(space) for space in (" ", "\n", "\t", "\r"))
+                # NOTE: Text separated only by other whitespace (U+3000, U+00A0, ...) must still be cut,
+                # or carry would grow to the whole file. Only the tail after the last ASCII space is searched.
+                space = LAST_SPACE.search(chunk, cut + 1)
+                if space:
+                    cut = space.start()
+                if cut == -1:
+                    # A single word longer than a chunk, keep reading until it ends
+                    carry = chunk
+                    continue
+                chunk, carry = chunk[:cut + 1], chunk[cut + 1:]
+            yield chunk
+        if carry:
+            yield carry
+
+    @staticmethod
+    def count_stream(stream, normalize=False, chunk_size=CHUNK_SIZE):
+        counts = Counter()
+        for chunk in Count.chunks(stream, chunk_size):
+            counts.update(Count.tokens(chunk, normalize))
+        return counts
+
+    @staticmethod
+    def count_file(file_name, normalize=False, chunk_size=CHUNK_SIZE):
+        with open(file_name, "r", encoding="utf-8", errors="replace") as file:
+            return Count.count_stream(file, normalize, chunk_size)
+
+    @staticmethod
+    def _files(paths):
+        for path in paths:
+            if os.path.isdir(path):
+                for folder, _, names in os.walk(path):
+                    for name in sorted(names):
+                        yield os.path.join(folder, name)
+            else:
+                yield path
+
+    @staticmethod
+    def _split_points(file_name, size, task_size):
+        # NOTE: Each cut moves forward to the next whitespace byte so no word is split.
+        # ASCII bytes never appear inside a multi-byte UTF-8 character.
+        points = [0]
+        with open(file_name, "rb") as file:
+            while size - points[-1] > task_size:
+                offset = points[-1] + task_size
+                file.seek(offset)
+                while True:
+                    block = file.read(64 * 1024)
+                    if not block:
+                        offset = size
+                        break
+                    hits = [index for index in map(block.find, WHITESPACE) if index != -1]
+                    if hits:
+                        offset += min(hits)
+                        break
+                    offset += len(block)
+                points.append(offset)
+        if points[-1] < size:
+            points.append(size)
+        return points
+
+    @staticmethod
+    def _tasks(paths, task_size):
+        # Small files are grouped and big files are split, so every task is about task_size bytes
+        batch, batch_size = [], 0
+        for file_name in Count._files(paths):
+            size = os.path.getsize(file_name)
+            points = Count._split_points(file_name, size, task_size) if size > task_size else [0, size]
+            for start, end in zip(points, points[1:]):
+                batch.append((file_name, start, end))
+                batch_size += end - start
+                if batch_size >= task_size:
+                    yield batch
+                    batch, batch_size = [], 0
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _read_range(file_name, start, end, chunk_size):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        with open(file_name, "rb") as file:
+            file.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                block = file.read(min(chunk_size, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                yield decoder.decode(block)
+        yield decoder.decode(b"", final=True)
+
+    @staticmethod
+    def _count_task(task, normalize, chunk_size):
+        # Map step: one partial Counter for the whole batch of files and file pieces
+        counts = Counter()
+        for file_name, start, end in task:
+            for chunk in Count._whole_words(Count._read_range(file_name, start, end, chunk_size)):
+                counts.update(Count.tokens(chunk, normalize))
+        return counts
+
+    @staticmethod
+    def _reduce(stack, counts, level=0):
+        # Streaming tree reduction: like carrying in binary addition, two partials of the same
+        # level merge into one of the next level, so at most log2(tasks) partials are ever held
+        while stack and stack[-1][0] == level:
+            _, other = stack.pop()
+            if len(other) > len(counts):
+                counts, other = other, counts
+            counts.update(other)
+            level += 1
+        stack.append((level, counts))
+
+    @staticmethod
+    def count_parallel(paths, workers=None, normalize=False, task_size=TASK_SIZE, chunk_size=CHUNK_SIZE):
+        workers = workers or os.cpu_count()
+        tasks = Count._tasks(paths, task_size)
+        stack = []
+        if workers == 1:
+            for task in tasks:
+                Count._reduce(stack, Count._count_task(task, normalize, chunk_size))
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                pending = set()
+                for task in tasks:
+                    # NOTE: Only a couple of tasks per worker are in flight, so finished partials
+                    # are reduced as they arrive instead of piling up
+                    if len(pending) >= 2 * workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            Count._reduce(stack, future.result())
+                    pending.add(executor.submit(Count._count_task, task, normalize, chunk_size))
+                for future in wait(pending).done:
+                    Count._reduce(stack, future.result())
+
+        # Fold what is left, at most one partial per level
+        counts = Counter()
+        while stack:
+            _, other = stack.pop()
+            if len(other) > len(counts):
+                counts, other = other, counts
+            counts.update(other)
+        return counts
+
+    @staticmethod
+    def top_k(counts, k=TOP_K):
+        # A k-sized heap, O(n log k), instead of sorting the whole vocabulary
+        return heapq.nlargest(k, counts.items(), key=itemgetter(1))
 
 
 if __name__ == "__main__":
-    Count.count_words("Hello World, How are you? Are you here to capture me? Are you insane?")
+    print(Count.count_words("Hello World, How are you? Are you here to capture me? Are you insane?"))
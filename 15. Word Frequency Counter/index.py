@@ -0,0 +1,125 @@
+import os
+import sqlite3
+
+from counter import TOP_K, Count
+
+DB_NAME = "words.db"
+COMMIT_POSTINGS = 200_000
+
+
+class WordIndex:
+    def __init__(self, db_name=DB_NAME, normalize=None):
+        self._connection = sqlite3.connect(db_name)
+        # NOTE: WAL makes each commit append to a log instead of rewriting the pages in place
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS files ("
+                                     "id INTEGER PRIMARY KEY, "
+                                     "path TEXT NOT NULL UNIQUE, "
+                                     "mtime_ns INTEGER NOT NULL, "
+                                     "size INTEGER NOT NULL, "
+                                     "words INTEGER NOT NULL)")
+            # NOTE: (word, file) is the primary key, so one word's per-file counts sit together in the B-tree
+            self._connection.execute("CREATE TABLE IF NOT EXISTS postings ("
+                                     "word TEXT NOT NULL, "
+                                     "file_id INTEGER NOT NULL, "
+                                     "count INTEGER NOT NULL, "
+                                     "PRIMARY KEY (word, file_id)) WITHOUT ROWID")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id)")
+            # Corpus-wide totals, kept up to date on every reindex so top-k never sums postings
+            self._connection.execute("CREATE TABLE IF NOT EXISTS totals ("
+                                     "word TEXT PRIMARY KEY, "
+                                     "count INTEGER NOT NULL) WITHOUT ROWID")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS totals_count ON totals (count)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS settings ("
+                                     "name TEXT PRIMARY KEY, "
+                                     "value TEXT NOT NULL)")
+            # normalize=None keeps whatever the index was built with
+            stored = self._connection.execute("SELECT value FROM settings WHERE name = 'normalize'").fetchone()
+            stored = stored is not None and stored[0] == "True"
+            if normalize is not None and normalize != stored:
+                # Counts made with a different tokenizer cannot be mixed, start over
+                self._connection.execute("DELETE FROM postings")
+                self._connection.execute("DELETE FROM totals")
+                self._connection.execute("DELETE FROM files")
+            self._normalize = stored if normalize is None else normalize
+            self._connection.execute("INSERT OR REPLACE INTO settings (name, value) VALUES ('normalize', ?)",
+                                     (str(self._normalize),))
+
+    def _remove(self, file_id):
+        self._connection.execute("UPDATE totals SET count = count - "
+                                 "(SELECT count FROM postings WHERE postings.word = totals.word AND file_id = ?) "
+                                 "WHERE word IN (SELECT word FROM postings WHERE file_id = ?)", (file_id, file_id))
+        self._connection.execute("DELETE FROM totals WHERE count <= 0")
+        self._connection.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        self._connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def _add(self, path, stat):
+        counts = Count.count_file(path, self._normalize)
+        cursor = self._connection.execute("INSERT INTO files (path, mtime_ns, size, words) VALUES (?, ?, ?, ?)",
+                                          (path, stat.st_mtime_ns, stat.st_size, counts.total()))
+        file_id = cursor.lastrowid
+        # Inserting in key order touches each B-tree page once instead of jumping around
+        items = sorted(counts.items())
+        self._connection.executemany("INSERT INTO postings (word, file_id, count) VALUES (?, ?, ?)",
+                                     ((word, file_id, count) for word, count in items))
+        self._connection.executemany("INSERT INTO totals (word, count) VALUES (?, ?) "
+                                     "ON CONFLICT(word) DO UPDATE SET count = count + excluded.count", items)
+        return len(items)
+
+    def update(self, paths):
+        # Reindexes only files whose mtime or size changed, and drops files that are gone
+        known = {path: (file_id, mtime_ns, size) for file_id, path, mtime_ns, size in
+                 self._connection.execute("SELECT id, path, mtime_ns, size FROM files")}
+        roots = [os.path.abspath(path) for path in paths]
+        indexed = skipped = removed = pending = 0
+        seen = set()
+        with self._connection:
+            for path in Count._files(roots):
+                seen.add(path)
+                stat = os.stat(path)
+                old = known.get(path)
+                if old is not None and old[1:] == (stat.st_mtime_ns, stat.st_size):
+                    skipped += 1
+                    continue
+                if old is not None:
+                    self._remove(old[0])
+                pending += self._add(path, stat)
+                indexed += 1
+                # NOTE: Files are committed in batches. An interrupted update loses only the
+                # current batch, and those files still look changed next time.
+                if pending >= COMMIT_POSTINGS:
+                    self._connection.commit()
+                    pending = 0
+
+            for path, (file_id, _, _) in known.items():
+                inside = any(path == root or path.startswith(root.rstrip(os.sep) + os.sep) for root in roots)
+                if inside and path not in seen:
+                    self._remove(file_id)
+                    removed += 1
+        return indexed, skipped, removed
+
+    def count(self, word):
+        row = self._connection.execute("SELECT count FROM totals WHERE word = ?", (word,)).fetchone()
+        return row[0] if row else 0
+
+    def files(self, word, k=TOP_K):
+        return self._connection.execute("SELECT path, count FROM postings JOIN files ON files.id = file_id "
+                                        "WHERE word = ? ORDER BY count DESC LIMIT ?", (word, k)).fetchall()
+
+    def top_k(self, k=TOP_K):
+        return self._connection.execute("SELECT word, count FROM totals ORDER BY count DESC LIMIT ?",
+                                        (k,)).fetchall()
+
+    def stats(self):
+        return self._connection.execute("SELECT COUNT(*), COALESCE(SUM(words), 0), "
+                                        "(SELECT COUNT(*) FROM totals) FROM files").fetchone()
+
+    def close(self):
+        self._connection.close()
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -0,0 +1,86 @@
+import argparse
+import os
+import sys
+from collections import Counter
+
+from counter import CHUNK_SIZE, TOP_K, Count
+from index import DB_NAME, WordIndex
+from sketch import CAPACITY, DEPTH, WIDTH, ApproximateCount
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Count how often each word appears in one or more files.")
+    parser.add_argument("files", nargs="*", help="text files or folders to count, or - for stdin (default: -)")
+    parser.add_argument("-k", "--top", type=int, default=TOP_K, help=f"how many of the most frequent words to show (default: {TOP_K})")
+    parser.add_argument("--word", action="append", default=[], help="also show the count of this word (can be repeated)")
+    parser.add_argument("--normalize", action="store_true", help="ignore case and punctuation around words")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"characters read at a time (default: {CHUNK_SIZE})")
+    parser.add_argument("--workers", type=int, help="count files and pieces of big files in this many processes (default: one process)")
+    parser.add_argument("--approximate", action="store_true", help="bounded memory: Count-Min Sketch plus heavy hitters")
+    parser.add_argument("--width", type=int, default=WIDTH, help=f"sketch counters per row (default: {WIDTH})")
+    parser.add_argument("--depth", type=int, default=DEPTH, help=f"sketch rows (default: {DEPTH})")
+    parser.add_argument("--capacity", type=int, default=CAPACITY, help=f"heavy hitters tracked (default: {CAPACITY})")
+    parser.add_argument("--index", nargs="?", const=DB_NAME, help=f"keep the counts in an on-disk index (default file: {DB_NAME}), "
+                                                                  "only changed files are counted again, and with no files the answers come straight from the index")
+    args = parser.parse_args(args)
+
+    if args.index:
+        show_index(args)
+        return
+    args.files = args.files or ["-"]
+
+    parallel = (not args.approximate and "-" not in args.files
+                and (args.workers or any(os.path.isdir(path) for path in args.files)))
+    if parallel:
+        # NOTE: Folders always go through the map-reduce path, it knows how to walk them
+        counts = Count.count_parallel(args.files, args.workers, args.normalize, chunk_size=args.chunk_size)
+    elif args.approximate:
+        counts = ApproximateCount(args.width, args.depth, max(args.capacity, args.top))
+    else:
+        counts = Counter()
+    for file_name in [] if parallel else args.files:
+        stream = sys.stdin if file_name == "-" else open(file_name, "r", encoding="utf-8", errors="replace")
+        with stream:
+            for chunk in Count.chunks(stream, args.chunk_size):
+                # Exact per-chunk counts, merged into the exact total or fed to the sketch
+                counts.update(Count.count_words(chunk, args.normalize))
+
+    if args.approximate:
+        top = counts.top_k(args.top)
+        total = counts.sketch.total
+    else:
+        top = Count.top_k(counts, args.top)
+        total = counts.total()
+
+    print(f"Words: {total}")
+    if not args.approximate:
+        print(f"Distinct words: {len(counts)}")
+    print(f"\nTop {len(top)}{' (estimated)' if args.approximate else ''}:")
+    for rank, (word, count) in enumerate(top, 1):
+        print(f"{rank:>4}. {word:<30} {count}")
+    for word in args.word:
+        print(f"\n{word}: {counts[word]}")
+
+
+def show_index(args):
+    index = WordIndex(args.index, True if args.normalize else None)
+    if args.files:
+        indexed, skipped, removed = index.update(args.files)
+        print(f"Indexed: {indexed}, unchanged: {skipped}, removed: {removed}")
+    files, words, distinct = index.stats()
+    print(f"Files: {files}"
+          f"\nWords: {words}"
+          f"\nDistinct words: {distinct}")
+    top = index.top_k(args.top)
+    print(f"\nTop {len(top)}:")
+    for rank, (word, count) in enumerate(top, 1):
+        print(f"{rank:>4}. {word:<30} {count}")
+    for word in args.word:
+        print(f"\n{word}: {index.count(word)}")
+        for path, count in index.files(word, args.top):
+            print(f"    {count:>8}  {path}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
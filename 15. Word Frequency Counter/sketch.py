@@ -0,0 +1,108 @@
+import heapq
+from array import array
+from operator import itemgetter
+
+from counter import CHUNK_SIZE, TOP_K, Count
+
+WIDTH = 1 << 20
+DEPTH = 4
+CAPACITY = 1000
+MASK = (1 << 64) - 1
+
+
+class CountMinSketch:
+    # depth rows of width counters. A word adds to one counter per row, and its estimate is
+    # the smallest of them: never too low, too high only by the collisions it shares with others.
+    def __init__(self, width=WIDTH, depth=DEPTH):
+        self.width = width
+        self.depth = depth
+        self._rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+        self.total = 0
+
+    def _columns(self, word):
+        # NOTE: Two hashes give all the rows (Kirsch-Mitzenmacher), hash() is salted per run,
+        # which is fine because the sketch only lives in memory
+        first = hash(word) & MASK
+        second = hash((word, 1)) & MASK | 1
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, word, count=1):
+        self.total += count
+        estimate = None
+        for row, column in zip(self._rows, self._columns(word)):
+            row[column] += count
+            if estimate is None or row[column] < estimate:
+                estimate = row[column]
+        return estimate
+
+    def estimate(self, word):
+        return min(row[column] for row, column in zip(self._rows, self._columns(word)))
+
+    def memory(self):
+        return self.depth * self.width * 8
+
+
+class ApproximateCount:
+    # Count-Min Sketch for the counts, plus a bounded set of heavy hitters for top-k.
+    # Memory stays fixed at the sketch size plus `capacity` words, whatever the vocabulary.
+    def __init__(self, width=WIDTH, depth=DEPTH, capacity=CAPACITY):
+        self.sketch = CountMinSketch(width, depth)
+        self._capacity = capacity
+        self._tracked = {}
+        # Min-heap of (estimate, word). Entries go stale when a word's estimate grows,
+        # stale ones are skipped when they reach the top.
+        self._heap = []
+
+    def _smallest(self):
+        while self._heap:
+            estimate, word = self._heap[0]
+            if self._tracked.get(word) == estimate:
+                return estimate, word
+            heapq.heappop(self._heap)
+        return None
+
+    def add(self, word, count=1):
+        estimate = self.sketch.add(word, count)
+        if word in self._tracked or len(self._tracked) < self._capacity:
+            self._tracked[word] = estimate
+        else:
+            smallest, smallest_word = self._smallest()
+            if estimate <= smallest:
+                return
+            del self._tracked[smallest_word]
+            heapq.heappop(self._heap)
+            self._tracked[word] = estimate
+        heapq.heappush(self._heap, (estimate, word))
+        if len(self._heap) > 4 * self._capacity:
+            self._heap = [(estimate, word) for word, estimate in self._tracked.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, counts):
+        for word, count in counts.items():
+            self.add(word, count)
+
+    def __getitem__(self, word):
+        return self.sketch.estimate(word)
+
+    def top_k(self, k=TOP_K):
+        return heapq.nlargest(k, self._tracked.items(), key=itemgetter(1))
+
+    @staticmethod
+    def count_stream(stream, normalize=False, chunk_size=CHUNK_SIZE, width=WIDTH, depth=DEPTH,
+                     capacity=CAPACITY):
+        approximate = ApproximateCount(width, depth, capacity)
+        for chunk in Count.chunks(stream, chunk_size):
+            # Exact counts within one chunk first, so each distinct word hits the sketch once per chunk
+            approximate.update(Count.count_words(chunk, normalize))
+        return approximate
+
+    @staticmethod
+    def count_file(file_name, normalize=False, chunk_size=CHUNK_SIZE, width=WIDTH, depth=DEPTH,
+                   capacity=CAPACITY):
+        with open(file_name, "r", encoding="utf-8", errors="replace") as file:
+            return ApproximateCount.count_stream(file, normalize, chunk_size, width, depth, capacity)
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -0,0 +1,106 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from merger import ListMerger
+
+
+def make_items(count, values):
+    # Ints and strings mixed, drawn from `values` of each kind
+    return [random.randrange(values) if random.random() < 0.5 else f"item{random.randrange(values)}"
+            for _ in range(count)]
+
+
+def old_merge(lists):
+    # marge_lists for any number of lists: concatenate, set, sort again
+    merged = []
+    for items in lists:
+        merged += items
+    return ListMerger._mixed_sort(ListMerger._remove_duplicates(merged))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def peak(function, *args):
+    tracemalloc.start()
+    function(*args)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(16)
+
+    print(f"Merging already sorted lists, {count} items in total")
+    print(f"{'Lists':>6} {'Old (set + sort)':>17} {'Heap merge':>12}")
+    for parts in (2, 8, 64):
+        lists = [ListMerger._mixed_sort(make_items(count // parts, count)) for _ in range(parts)]
+        old, old_time = timed(old_merge, lists)
+        new, new_time = timed(lambda: list(ListMerger.merge(*lists)))
+        assert old == new
+        print(f"{parts:>6} {old_time:>16.2f}s {new_time:>11.2f}s")
+
+    # The merge only holds one item per list, nothing is built up front
+    lists = [ListMerger._mixed_sort(make_items(count // 8, count)) for _ in range(8)]
+    old_peak = peak(old_merge, lists)
+    new_peak = peak(lambda: sum(1 for _ in ListMerger.merge(*lists)))
+    print(f"Peak memory with 8 lists: old {old_peak / 2**20:.1f} MB, heap merge {new_peak / 2**20:.3f} MB")
+
+    items = make_items(count, count)
+    expected, sort_time = timed(lambda: ListMerger._mixed_sort(set(items)))
+    print(f"\nExternal sort of {count} unsorted items")
+    print(f"{'Run size':>10} {'Runs':>6} {'Time':>8} {'Peak':>10}")
+    print(f"{'in memory':>10} {1:>6} {sort_time:>7.2f}s {peak(lambda: ListMerger._mixed_sort(set(items))) / 2**20:>7.1f} MB")
+    for run_size in (count // 4, count // 64, count // 1024):
+        result, elapsed = timed(lambda: list(ListMerger.external_sort(items, run_size)))
+        assert result == expected
+        memory = peak(lambda: sum(1 for _ in ListMerger.external_sort(items, run_size)))
+        runs = -(-count // run_size)
+        print(f"{run_size:>10} {runs:>6} {elapsed:>7.2f}s {memory / 2**20:>7.1f} MB")
+
+    set_benchmark(count)
+
+
+def set_benchmark(count):
+    print(f"\nSet algebra on sorted IDs{'':<19}{'set()':>10} {'Forward':>9} {'Adaptive':>10}")
+    big = 5 * count
+    balanced = (sorted(random.sample(range(2 * count), count)), sorted(random.sample(range(2 * count), count)))
+    with tempfile.TemporaryDirectory() as folder:
+        # The big side is an on-disk ID file, searched through a memory map
+        file_name = os.path.join(folder, "big.ids")
+        ListMerger.write_ids(file_name, range(0, 2 * big, 2))
+        ids = ListMerger.read_ids(file_name)
+        cases = [(f"intersection {count} & {count}", ListMerger.intersection, *balanced),
+                 (f"difference {count} - {count}", ListMerger.difference, *balanced)]
+        for small in (10_000, 100):
+            cases.append((f"intersection {small} & {big} file", ListMerger.intersection,
+                          sorted(random.sample(range(2 * big), small)), ids))
+        cases.append((f"difference 100 - {big} file", ListMerger.difference, cases[-1][2], ids))
+
+        for label, operation, first, second in cases:
+            result, elapsed = timed(lambda: list(operation(first, second)))
+            # The same operation reading both inputs forward only, one item at a time
+            linear, linear_time = timed(lambda: list(operation(iter(first), iter(second))))
+            assert result == linear
+            if len(second) <= count:
+                expected, set_time = timed(lambda: sorted(set(first) & set(second) if operation is ListMerger.intersection
+                                                          else set(first) - set(second)))
+                assert result == expected
+                set_column = f"{set_time:>9.3f}s"
+            else:
+                set_column = f"{'-':>10}"
+            print(f"{label:<43}{set_column} {linear_time:>8.3f}s {elapsed:>9.4f}s")
+        del ids
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,48 @@
 
+import argparse
+import sys
+
 from merger import *
 from utils import *
 
 
+def merge_files(args=None):
+    parser = argparse.ArgumentParser(description="Merge files with one item per line into one sorted list without duplicates.")
+    parser.add_argument("files", nargs="+", help="files to merge, each already sorted unless --unsorted is given, .ids files hold binary IDs")
+    parser.add_argument("--operation", choices=("union", "intersection", "difference"), default="union",
+                        help="union: items in any file, intersection: in every file, difference: in the first file only (default: union)")
+    parser.add_argument("-o", "--output", help="write the result to this file instead of printing it")
+    parser.add_argument("--unsorted", action="store_true", help="the files are not sorted, sort them with temporary files on disk")
+    parser.add_argument("--run-size", type=int, default=RUN_SIZE, help=f"items sorted in memory at a time with --unsorted (default: {RUN_SIZE})")
+    args = parser.parse_args(args)
+
+    readers = [ListMerger.open_file(file_name) for file_name in args.files]
+    if args.unsorted:
+        readers = [ListMerger.external_sort(reader, args.run_size) for reader in readers]
+    items = getattr(ListMerger, args.operation)(*readers)
+
+    try:
+        if args.output:
+            print(f"{ListMerger.write_file(args.output, items)} items written to {args.output}")
+        else:
+            for item in items:
+                print(item)
+    except ValueError as error:
+        print(f"{error}, merge it with --unsorted")
+
+
+if len(sys.argv) > 1:
+    merge_files()
+    exit()
+
 beautify("List Merger")
 
 while True:
-    list_1 = input("Enter list 1: ").split()
-    list_2 = input("Enter list 2: ").split()
-    
+    list_1 = [ListMerger.parse(item) for item in input("Enter list 1: ").split()]
+    list_2 = [ListMerger.parse(item) for item in input("Enter list 2: ").split()]
+
     merger = ListMerger(list_1, list_2)
     print(merger.marge_lists())
 
     if input("Do you want to continue? (y/n): ") == "n":
-        exit()
\ No newline at end of file
+        exit()
@@ -1,3 +1,22 @@
+import heapq
+import math
+import mmap
+import os
+import pickle
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from itertools import chain, count, islice
+from operator import le
+
+RUN_SIZE = 1_000_000
+BLOCK_SIZE = 1_000
+FAN_IN = 64
+GALLOP_RATIO = 10
+# Below every (0, int) and (1, str) key
+START = (0, -math.inf)
+
 
 class ListMerger:
     def __init__(self, list_1, list_2):
@@ -17,10 +36,334 @@ class ListMerger:
         str_part = sorted(i for i in user_list if isinstance(i, str))
         return int_part + str_part
 
-    
+    @staticmethod
+    def _ints(items, number, rest):
+        # The int part of a sorted input. It stops at the first str and leaves it in rest,
+        # anything that is neither is left out, just like _mixed_sort does.
+        previous = None
+        for item in items:
+            if isinstance(item, str):
+                rest.append(item)
+                return
+            if not isinstance(item, int):
+                continue
+            if previous is not None and item < previous:
+                raise ValueError(f"input {number} is not sorted: {item!r} comes after {previous!r}")
+            previous = item
+            yield item
+
+    @staticmethod
+    def _strs(items, number):
+        previous = None
+        for item in items:
+            if not isinstance(item, str):
+                if isinstance(item, int):
+                    raise ValueError(f"input {number} is not sorted: {item!r} comes after {previous!r}")
+                continue
+            if previous is not None and item < previous:
+                raise ValueError(f"input {number} is not sorted: {item!r} comes after {previous!r}")
+            previous = item
+            yield item
+
+    @staticmethod
+    def merge(*iterables):
+        # NOTE: Lazy k-way merge of already sorted inputs, lists, generators or files.
+        # Only one item per input is held in the heap, and equal items arrive next to
+        # each other, so duplicates are dropped by comparing with the last one.
+        # Ints come before strs, like _mixed_sort, so all the int parts are merged first
+        # and then all the str parts. Neither heap ever compares an int with a str.
+        iterators = [iter(iterable) for iterable in iterables]
+        rests = [[] for _ in iterators]
+        previous = None
+        for item in heapq.merge(*(ListMerger._ints(iterator, number, rest)
+                                  for number, (iterator, rest) in enumerate(zip(iterators, rests), 1))):
+            if item != previous:
+                previous = item
+                yield item
+        for item in heapq.merge(*(ListMerger._strs(chain(rest, iterator), number)
+                                  for number, (iterator, rest) in enumerate(zip(iterators, rests), 1))):
+            if item != previous:
+                previous = item
+                yield item
+
+    @staticmethod
+    def _key(item):
+        return (0, item) if isinstance(item, int) else (1, item)
+
+    @staticmethod
+    def _keys(iterable, number):
+        # Keys of a sorted input, checked on the way like merge() does
+        previous = None
+        for item in iterable:
+            if isinstance(item, int):
+                key = (0, item)
+            elif isinstance(item, str):
+                key = (1, item)
+            else:
+                continue
+            if previous is not None and key < previous:
+                raise ValueError(f"input {number} is not sorted: {item!r} comes after {previous[1]!r}")
+            previous = key
+            yield key
+
+    @staticmethod
+    def _cursors(inputs, lead_size, first_number=1):
+        # NOTE: Lists, arrays and id files can be searched, so they gallop, but only when they
+        # are GALLOP_RATIO times longer than the input that leads. Between inputs of similar
+        # size most searches move an item or two, and reading forward is cheaper. Anything
+        # else can only be read forward. The smallest searchable input goes first.
+        numbered = list(enumerate(inputs, first_number))
+        sequences = sorted(((number, items) for number, items in numbered if isinstance(items, Sequence)),
+                           key=lambda pair: len(pair[1]))
+        streams = [(number, items) for number, items in numbered if not isinstance(items, Sequence)]
+        return [_SequenceCursor(items, number) if isinstance(items, Sequence) and len(items) >= GALLOP_RATIO * lead_size
+                else _StreamCursor(items, number) for number, items in sequences + streams]
+
+    @staticmethod
+    def union(*inputs):
+        return ListMerger.merge(*inputs)
+
+    @staticmethod
+    def intersection(*inputs):
+        # Leapfrog: the leading input proposes an item, every other input jumps to the first
+        # item not below it. A larger item found on the way becomes the next proposal, so
+        # whole stretches of a big input are skipped without being read.
+        if not inputs:
+            return
+        sizes = [len(items) for items in inputs if isinstance(items, Sequence)]
+        cursors = ListMerger._cursors(inputs, min(sizes, default=0))
+        target = cursors[0].seek(START)
+        while target is not None:
+            for cursor in cursors[1:]:
+                key = cursor.seek(target)
+                if key is None:
+                    return
+                if key != target:
+                    target = cursors[0].seek(key)
+                    break
+            else:
+                yield target[1]
+                target = cursors[0].seek(target, True)
+
+    @staticmethod
+    def difference(first, *others):
+        # Items of first that are in none of the others. first is read in full, the others
+        # are only searched for the items of first.
+        cursors = ListMerger._cursors(others, len(first) if isinstance(first, Sequence) else 0, 2)
+        previous = None
+        for key in ListMerger._keys(first, 1):
+            if key == previous:
+                continue
+            previous = key
+            if not any(cursor.seek(key) == key for cursor in cursors):
+                yield key[1]
+
+    @staticmethod
+    def _write_run(file_name, items):
+        # Pickled in blocks, one dump per item would be slower than the sort itself
+        with open(file_name, "wb") as file:
+            items = iter(items)
+            while block := list(islice(items, BLOCK_SIZE)):
+                pickle.dump(block, file, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _read_run(file_name):
+        with open(file_name, "rb") as file:
+            while True:
+                try:
+                    block = pickle.load(file)
+                except EOFError:
+                    return
+                yield from block
+
+    @staticmethod
+    def _merge_runs(run_files):
+        readers = [ListMerger._read_run(file_name) for file_name in run_files]
+        try:
+            yield from ListMerger.merge(*readers)
+        finally:
+            for reader in readers:
+                reader.close()
+
+    @staticmethod
+    def external_sort(iterable, run_size=RUN_SIZE, folder=None):
+        # Sorted and deduplicated like marge_lists, for input that does not fit in memory.
+        # run_size items at a time are sorted in memory and spilled to a temporary file,
+        # then the runs are merged. Input that fits in one run never touches the disk.
+        items = iter(iterable)
+        run = list(islice(items, run_size))
+        if len(run) < run_size:
+            yield from ListMerger._mixed_sort(set(run))
+            return
+
+        with tempfile.TemporaryDirectory(dir=folder) as temp_folder:
+            names = (os.path.join(temp_folder, f"run{number}.pickle") for number in count())
+            run_files = []
+            while run:
+                run_files.append(next(names))
+                ListMerger._write_run(run_files[-1], ListMerger._mixed_sort(set(run)))
+                run = list(islice(items, run_size))
+
+            # NOTE: At most FAN_IN runs are open at once, more runs are merged in passes
+            while len(run_files) > FAN_IN:
+                merged = []
+                for start in range(0, len(run_files), FAN_IN):
+                    merged.append(next(names))
+                    ListMerger._write_run(merged[-1], ListMerger._merge_runs(run_files[start:start + FAN_IN]))
+                for file_name in run_files:
+                    os.remove(file_name)
+                run_files = merged
+
+            yield from ListMerger._merge_runs(run_files)
+
+    @staticmethod
+    def parse(word):
+        # Whole numbers become int, everything else stays str, so numbers sort as numbers
+        if word.isdecimal() or (word[:1] == "-" and word[1:].isdecimal()):
+            return int(word)
+        return word
+
+    @staticmethod
+    def read_file(file_name):
+        # One item per line
+        with open(file_name, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.rstrip("\n")
+                if line:
+                    yield ListMerger.parse(line)
+
+    @staticmethod
+    def write_ids(file_name, ids):
+        # Sorted int IDs as raw 8-byte integers, so read_ids() can search them in place.
+        # NOTE: Unsorted IDs are refused here, so the searches never have to read a whole file to check
+        ids = iter(ids)
+        written = 0
+        previous = None
+        try:
+            with open(file_name, "wb") as file:
+                while block := array("q", islice(ids, BLOCK_SIZE)):
+                    if previous is not None and block[0] < previous or not all(map(le, block, islice(block, 1, None))):
+                        for before, item in zip(chain([previous], block), block):
+                            if before is not None and item < before:
+                                raise ValueError(f"IDs are not sorted: {item!r} comes after {before!r}")
+                    previous = block[-1]
+                    block.tofile(file)
+                    written += len(block)
+        except ValueError:
+            os.remove(file_name)
+            raise
+        return written
+
+    @staticmethod
+    def read_ids(file_name):
+        # NOTE: A memory map, nothing is read up front. Only the pages a search touches
+        # are loaded, so galloping through a file of millions of IDs reads a few pages.
+        with open(file_name, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return _IdFile(memoryview(b"").cast("q"))
+            return _IdFile(memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)).cast("q"))
+
+    @staticmethod
+    def open_file(file_name):
+        # .ids files are binary ID lists, anything else is text with one item per line
+        if file_name.endswith(".ids"):
+            return ListMerger.read_ids(file_name)
+        return ListMerger.read_file(file_name)
+
+    @staticmethod
+    def write_file(file_name, items):
+        items = iter(items)
+        written = 0
+        with open(file_name, "w", encoding="utf-8") as file:
+            while block := list(islice(items, BLOCK_SIZE)):
+                file.write("\n".join(map(str, block)))
+                file.write("\n")
+                written += len(block)
+        return written
+
+
+class _IdFile(Sequence):
+    # The IDs of a file from read_ids(). write_ids() refused unsorted IDs, so the cursors trust
+    # its order instead of reading the whole file to check it.
+    def __init__(self, ids):
+        self._ids = ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        return self._ids[index]
+
+    def __iter__(self):
+        return iter(self._ids)
+
+
+class _SequenceCursor:
+    def __init__(self, sequence, number):
+        if not isinstance(sequence, _IdFile):
+            self._check_sorted(sequence, number)
+        self._sequence = sequence
+        self._position = 0
+
+    @staticmethod
+    def _check_sorted(sequence, number):
+        # NOTE: Galloping skips most items, so an unsorted input would give wrong answers without
+        # any error. The whole sequence is checked once, pairwise in C when its items compare
+        # directly (all ints or all strings), which is still far cheaper than reading it in Python.
+        try:
+            if all(map(le, sequence, islice(sequence, 1, None))):
+                return
+        except TypeError:
+            pass
+        # Ints mixed with strings, or out of order: the key check raises the same error merge() does
+        for _ in ListMerger._keys(sequence, number):
+            pass
+
+    def seek(self, target, past=False):
+        # Moves to the first item not below target (above it with past=True) and returns
+        # its key, or None at the end. Exponential search from the current position: steps
+        # of 1, 2, 4, ... until an item is not below target, then a binary search inside the
+        # last step. Jumping d items costs O(log d), whatever the length of the sequence.
+        sequence = self._sequence
+        size = len(sequence)
+        key = ListMerger._key
+        low = probe = self._position
+        step = 1
+        while probe < size:
+            current = key(sequence[probe])
+            if current > target if past else current >= target:
+                break
+            low = probe + 1
+            probe += step
+            step *= 2
+        else:
+            probe = size
+            current = None
+        # NOTE: Inputs of similar size mostly move by one item or none, those stop at the
+        # first probe and skip the binary search
+        if low < probe:
+            probe = (bisect_right if past else bisect_left)(sequence, target, low, probe, key=key)
+            current = key(sequence[probe]) if probe < size else None
+        self._position = probe
+        return current
+
+
+class _StreamCursor:
+    def __init__(self, items, number):
+        self._keys = ListMerger._keys(items, number)
+        self._current = next(self._keys, None)
+
+    def seek(self, target, past=False):
+        # A stream cannot jump, it reads forward one item at a time
+        current = self._current
+        while current is not None and (current <= target if past else current < target):
+            current = next(self._keys, None)
+        self._current = current
+        return current
+
+
 if __name__ == "__main__":
     list_1 = [1, 2, 'a', 'z', 5]
     list_2 = [4, 'A', 6, 7, 8]
     merger = ListMerger(list_1, list_2)
     print(merger.marge_lists())
-
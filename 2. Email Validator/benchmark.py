@@ -0,0 +1,85 @@
+import random
+import sys
+import time
+
+from validator import EMAIL_PATTERN, Validator
+
+ALPHABET = ["a", "Z", "0", "_", ".", "-", "@", "c", "o", "m", ".com", "\n", " ", "é", "٣", "²", "ß", "!", "+"]
+VALID = ["john.doe@example.com", "a-b@c.com", "user_1@site.com", "x@com.com"]
+
+
+def reference(email):
+    return EMAIL_PATTERN.match(email) is not None
+
+
+def every_character():
+    # Single characters decide the whole language, so \w and _is_word must agree on all of them
+    mismatches = []
+    for code in range(sys.maxunicode + 1):
+        char = chr(code)
+        if reference(f"{char}@{char}.com") != Validator.check(f"{char}@{char}.com"):
+            mismatches.append(hex(code))
+    return mismatches
+
+
+def mutate(email):
+    chars = list(email)
+    for _ in range(random.randint(1, 3)):
+        action = random.choice(["insert", "delete", "replace"])
+        position = random.randint(0, len(chars))
+        if action == "insert":
+            chars.insert(position, random.choice(ALPHABET))
+        elif chars and position < len(chars):
+            if action == "delete":
+                del chars[position]
+            else:
+                chars[position] = random.choice(ALPHABET)
+    return "".join(chars)
+
+
+def fuzz(rounds):
+    random.seed(7)
+    mismatches = []
+    for _ in range(rounds):
+        if random.random() < 0.5:
+            email = "".join(random.choice(ALPHABET) for _ in range(random.randint(0, 12)))
+        else:
+            email = mutate(random.choice(VALID))
+        if reference(email) != Validator.check(email):
+            mismatches.append(email)
+    return mismatches
+
+
+def worst_case():
+    print("\nLength   Regex        Scanner")
+    for length in range(16, 27, 2):
+        # A long local part with no "@" makes the nested quantifier try every split
+        email = "a" * length + "!"
+        start = time.perf_counter()
+        reference(email)
+        regex_time = time.perf_counter() - start
+        start = time.perf_counter()
+        Validator.check(email)
+        scanner_time = time.perf_counter() - start
+        print(f"{length:6d} {regex_time:9.4f}s {scanner_time * 1e6:9.1f}us")
+        if regex_time > 5:
+            break
+
+    for length in (10_000, 1_000_000):
+        email = "a." * length + "a@b.co"
+        start = time.perf_counter()
+        Validator.check(email)
+        print(f"{length * 2 + 6:>9} chars, scanner only: {(time.perf_counter() - start) * 1e3:.2f}ms")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    mismatches = every_character()
+    print(f"Single characters checked: {sys.maxunicode + 1}, mismatches: {len(mismatches)} {mismatches[:10]}")
+    mismatches = fuzz(rounds)
+    print(f"Fuzzed addresses checked: {rounds}, mismatches: {len(mismatches)} {mismatches[:10]}")
+    worst_case()
+
+
+if __name__ == "__main__":
+    main()
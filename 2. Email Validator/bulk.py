@@ -0,0 +1,149 @@
+import argparse
+import csv
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from cache import CACHE_SIZE, ValidationCache
+
+BATCH_SIZE = 10_000
+BATCHES_PER_WORKER = 4
+
+# NOTE: One cache per process, it lives across the batches that process validates
+_cache = None
+
+
+def _init_cache(max_size):
+    global _cache
+    _cache = ValidationCache(max_size)
+
+
+class BulkValidator:
+    def __init__(self, input_file, valid_file, invalid_file, column=None, workers=1, batch_size=BATCH_SIZE,
+                 cache_size=CACHE_SIZE):
+        self._input_file = input_file
+        self._valid_file = valid_file
+        self._invalid_file = invalid_file
+        self._column = column
+        self._workers = workers
+        self._batch_size = batch_size
+        self._cache_size = cache_size
+        self.cache_stats = (0, 0, 0, 0)
+
+    @staticmethod
+    def _validate_batch(emails):
+        _cache.new_batch()
+        before = _cache.stats()
+        results = [_cache.check(email) for email in emails]
+        return results, tuple(after - start for after, start in zip(_cache.stats(), before))
+
+    def _column_index(self, header):
+        try:
+            return header.index(self._column)
+        except ValueError:
+            raise ValueError(f"Column '{self._column}' not found in {self._input_file}")
+
+    def _batches(self, rows, index):
+        while True:
+            batch = list(islice(rows, self._batch_size))
+            if not batch:
+                return
+            if index is None:
+                yield batch, [row.strip() for row in batch]
+            else:
+                yield batch, [row[index].strip() if len(row) > index else "" for row in batch]
+
+    def _results(self, batches):
+        if self._workers == 1:
+            _init_cache(self._cache_size)
+            for rows, emails in batches:
+                yield rows, self._validate_batch(emails)
+            return
+
+        # NOTE: Only a few batches are in flight at once so memory stays bounded on huge inputs
+        with ProcessPoolExecutor(self._workers, initializer=_init_cache, initargs=(self._cache_size,)) as executor:
+            pending = deque()
+            for rows, emails in batches:
+                pending.append((rows, executor.submit(self._validate_batch, emails)))
+                if len(pending) >= self._workers * BATCHES_PER_WORKER:
+                    rows, future = pending.popleft()
+                    yield rows, future.result()
+            while pending:
+                rows, future = pending.popleft()
+                yield rows, future.result()
+
+    def run(self):
+        total = valid = 0
+        start = time.perf_counter()
+        with open(self._input_file, "r", encoding="utf-8", newline="") as source:
+            header = None
+            if self._column is None:
+                rows = (line.rstrip("\r\n") for line in source)
+                index = None
+            else:
+                rows = csv.reader(source)
+                if self._column.isdigit():
+                    index = int(self._column)
+                else:
+                    # NOTE: The column is looked up before the outputs are opened, a typo must not truncate them
+                    header = next(rows, [])
+                    index = self._column_index(header)
+            with (open(self._valid_file, "w", encoding="utf-8", newline="") as valid_output,
+                  open(self._invalid_file, "w", encoding="utf-8", newline="") as invalid_output):
+                if self._column is None:
+                    write_valid = lambda row: valid_output.write(row + "\n")
+                    write_invalid = lambda row: invalid_output.write(row + "\n")
+                else:
+                    valid_writer = csv.writer(valid_output)
+                    invalid_writer = csv.writer(invalid_output)
+                    if header is not None:
+                        valid_writer.writerow(header)
+                        invalid_writer.writerow(header)
+                    write_valid = valid_writer.writerow
+                    write_invalid = invalid_writer.writerow
+
+                for rows_batch, (results, stats) in self._results(self._batches(rows, index)):
+                    self.cache_stats = tuple(map(sum, zip(self.cache_stats, stats)))
+                    for row, is_valid in zip(rows_batch, results):
+                        if is_valid:
+                            write_valid(row)
+                            valid += 1
+                        else:
+                            write_invalid(row)
+                    total += len(rows_batch)
+        elapsed = time.perf_counter() - start
+        return total, valid, total - valid, elapsed
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Validate a list of email addresses in bulk.")
+    parser.add_argument("input", help="text file with one address per line, or a CSV file with --column")
+    parser.add_argument("--column", help="CSV column holding the address (header name, or 0-based index for files without a header)")
+    parser.add_argument("--valid", default="valid.txt", help="output for valid rows (default: valid.txt)")
+    parser.add_argument("--invalid", default="invalid.txt", help="output for invalid rows (default: invalid.txt)")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help=f"addresses per batch (default: {BATCH_SIZE})")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE, help=f"cached results per worker, 0 to disable (default: {CACHE_SIZE})")
+    args = parser.parse_args(args)
+
+    bulk = BulkValidator(args.input, args.valid, args.invalid, args.column, args.workers, args.batch_size,
+                         args.cache_size)
+    try:
+        total, valid, invalid, elapsed = bulk.run()
+    except ValueError as e:
+        # An unknown --column, reported before any output file was touched
+        parser.error(str(e))
+    hits, misses, domain_hits, domain_misses = bulk.cache_stats
+    print(f"Checked: {total}"
+          f"\nValid: {valid}"
+          f"\nInvalid: {invalid}"
+          f"\nTime: {elapsed:.2f}s"
+          f"\nThroughput: {total / elapsed if elapsed else 0:,.0f} addresses/s"
+          f"\nCache: {hits} hits, {misses} misses ({hits / (hits + misses) if total else 0:.1%} hit rate)"
+          f"\nDomains: {domain_hits} hits, {domain_misses} misses")
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
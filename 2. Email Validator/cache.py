@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+from validator import Validator
+
+CACHE_SIZE = 100_000
+
+
+class ValidationCache:
+    def __init__(self, max_size=CACHE_SIZE):
+        self._max_size = max_size
+        self._results = OrderedDict()
+        self._domains = {}
+        self.hits = 0
+        self.misses = 0
+        self.domain_hits = 0
+        self.domain_misses = 0
+
+    def check(self, email):
+        result = self._results.get(email)
+        if result is not None:
+            self._results.move_to_end(email)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self._check_uncached(email)
+        if self._max_size > 0:
+            self._results[email] = result
+            if len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+        return result
+
+    def _check_uncached(self, email):
+        local, at, domain = Validator.split(email)
+        if not at or not Validator.check_local(local):
+            return False
+
+        valid = self._domains.get(domain)
+        if valid is None:
+            self.domain_misses += 1
+            valid = self._domains[domain] = Validator.check_domain(domain)
+        else:
+            self.domain_hits += 1
+        return valid
+
+    def new_batch(self):
+        # NOTE: Domains are only memoized per batch so the memo cannot grow without bound
+        self._domains.clear()
+
+    def stats(self):
+        return self.hits, self.misses, self.domain_hits, self.domain_misses
+
+    def __len__(self):
+        return len(self._results)
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
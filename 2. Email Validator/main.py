@@ -1,8 +1,21 @@
+import sys
+import bulk
 from validator import Validator
 
-email = input("Enter your email: ")
-validator = Validator(email)
-if validator.is_valid():
-    print("Your mail is Valid email")
-else:
-    print("Your mail is Invalid email")
\ No newline at end of file
+
+# NOTE: Worker processes re-import this module under spawn (Windows, macOS), so nothing may run at import time
+def main():
+    if len(sys.argv) > 1:
+        bulk.main(sys.argv[1:])
+        return
+
+    email = input("Enter your email: ")
+    validator = Validator(email)
+    if validator.is_valid():
+        print("Your mail is Valid email")
+    else:
+        print("Your mail is Invalid email")
+
+
+if __name__ == "__main__":
+    main()
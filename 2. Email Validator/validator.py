@@ -1,12 +1,41 @@
 import re
 
+# NOTE: Reference pattern, check() accepts the same language without backtracking.
+# The nested quantifier makes this one exponential on long local parts without an "@".
+EMAIL_PATTERN = re.compile(r'^\w+([\.-]?\w+)*@\w+([\.]com$)+')
+
 class Validator:
     def __init__(self, email):
         self._email = email
         
     def is_valid(self):
-        pattern = r'^\w+([\.-]?\w+)*@\w+([\.]com$)+'
-        return re.match(pattern, self._email)
+        return self.check(self._email)
+
+    @staticmethod
+    def _is_word(text):
+        # Same characters as \w: str.isalnum() plus underscore, and at least one of them
+        return text.replace("_", "a").isalnum()
+
+    @staticmethod
+    def check_local(local):
+        # Word runs joined by single "." or "-", no separator at either end
+        return all(map(Validator._is_word, local.replace("-", ".").split(".")))
+
+    @staticmethod
+    def check_domain(domain):
+        return domain.endswith(".com") and Validator._is_word(domain[:-4])
+
+    @staticmethod
+    def split(email):
+        # `$` in the reference pattern also matches right before a single trailing newline
+        if email.endswith("\n"):
+            email = email[:-1]
+        return email.partition("@")
+
+    @staticmethod
+    def check(email):
+        local, at, domain = Validator.split(email)
+        return bool(at) and Validator.check_local(local) and Validator.check_domain(domain)
 
 # NOTE: Test Code
 if __name__ == "__main__":
@@ -1,38 +1,26 @@
-def file_add(item):
-    with open("list.txt", "a") as file:
-        file.write(f"{item}\n")
+def file_add(storage, item):
+    storage.add(item)
 
-def file_read():
-    with open("list.txt", "r") as file:
-        return file.read().splitlines()
+def file_read(storage):
+    return storage.items()
 
-def file_delete_item():
-    items = []
-    with open("list.txt", "r") as file:
-        items = file.readlines()
-    
+def file_delete_item(storage):
     item = input("Enter the name of the item to delete: ").casefold()
-    item = item + "\n"
-    
-    try:
-        if item in items:
-            items.remove(item)
-    except ValueError:
-        raise ValueError("Item not found in the list.")
+
+    if storage.remove(item):
+        print(f"{item.title()} has been removed from the list.")
     else:
-        with open("list.txt", "w") as file:
-            for item in items:
-                file.write(item)
+        print("Item not found in the list.")
 
 
-def add_item():
+def add_item(storage):
     item = input("Enter the name of the item to add: ")
     print(f"{item} has been successfully added to the list.")
-    file_add(item.casefold())
+    file_add(storage, item.casefold())
     return item
 
-def display():
-    items = file_read()
+def display(storage):
+    items = file_read(storage)
     print("Shopping List\n")
     for item in items:
         print(f"- {item.title()}")
\ No newline at end of file
@@ -1,15 +1,8 @@
 import list_manager as listManager
+from storage import ListStorage
 
 
-items = []
-
-try:
-    with open("list.txt", "r") as file:
-        for item in file.readlines():
-            items.append(item.strip())
-except FileNotFoundError:
-    with open("list.txt", "w"):
-        pass
+storage = ListStorage()
 
 while True:
     print("\n" + "="*40)
@@ -24,12 +17,13 @@ while True:
     
     match choice:
         case "1":
-            items.append(listManager.add_item())
+            listManager.add_item(storage)
         case "2":
-            listManager.file_delete_item()
+            listManager.file_delete_item(storage)
         case "3":
-            listManager.display()
+            listManager.display(storage)
         case "0":
+            storage.close()
             print("Thank You for using the Application\nGoodbye!!!")
             exit()
         case _:
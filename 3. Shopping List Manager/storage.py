@@ -0,0 +1,113 @@
+import os
+import threading
+
+FILE_NAME = "list.txt"
+COMPACT_THRESHOLD = 64 * 1024
+ADD = "+\t"
+REMOVE = "-\t"
+
+
+class ListStorage:
+    def __init__(self, file_name=FILE_NAME, compact_threshold=COMPACT_THRESHOLD):
+        self._file_name = file_name
+        self._compact_threshold = compact_threshold
+        self._items = {}
+        self._records = 0
+        self._lock = threading.Lock()
+        self._compactor = None
+        self._load()
+        self._log = open(self._file_name, "ab")
+
+    def _load(self):
+        try:
+            with open(self._file_name, "r", encoding="utf-8") as file:
+                for line in file:
+                    self._apply(line.rstrip("\n"))
+        except FileNotFoundError:
+            pass
+
+    def _apply(self, record):
+        if not record:
+            return
+        self._records += 1
+        if record.startswith(REMOVE):
+            item = record[len(REMOVE):]
+            quantity = self._items.get(item, 0)
+            if quantity > 1:
+                self._items[item] = quantity - 1
+            elif quantity == 1:
+                del self._items[item]
+        else:
+            # NOTE: Plain lines are the old list.txt format, they mean "add"
+            item = record[len(ADD):] if record.startswith(ADD) else record
+            self._items[item] = self._items.get(item, 0) + 1
+
+    def _append(self, record):
+        with self._lock:
+            self._log.write(f"{record}\n".encode("utf-8"))
+            self._log.flush()
+            self._apply(record)
+        self._maybe_compact()
+
+    def add(self, item):
+        self._append(ADD + item)
+
+    def remove(self, item):
+        if item not in self._items:
+            return False
+        self._append(REMOVE + item)
+        return True
+
+    def items(self):
+        with self._lock:
+            return [item for item, quantity in self._items.items() for _ in range(quantity)]
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return sum(self._items.values())
+
+    def _maybe_compact(self):
+        with self._lock:
+            if self._compactor is not None:
+                return
+            if self._log.tell() < self._compact_threshold or self._records <= 2 * len(self._items):
+                return
+            self._compactor = threading.Thread(target=self._compact, daemon=True)
+            self._compactor.start()
+
+    def _compact(self):
+        with self._lock:
+            snapshot = list(self._items.items())
+            offset = self._log.tell()
+
+        # NOTE: The live items are written outside the lock so adds and removes are not blocked
+        temp_name = self._file_name + ".compact"
+        with open(temp_name, "w", encoding="utf-8") as file:
+            for item, quantity in snapshot:
+                # Written as add records, a plain line would lose an empty item or misread one starting with "-\t"
+                file.write(f"{ADD}{item}\n" * quantity)
+
+        with self._lock:
+            # Records appended while the snapshot was written are copied over as they are
+            with open(self._file_name, "rb") as log, open(temp_name, "ab") as file:
+                log.seek(offset)
+                tail = log.read()
+                file.write(tail)
+            self._log.close()
+            os.replace(temp_name, self._file_name)
+            self._log = open(self._file_name, "ab")
+            self._records = sum(quantity for _, quantity in snapshot) + tail.count(b"\n")
+            self._compactor = None
+
+    def close(self):
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        self._log.close()
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
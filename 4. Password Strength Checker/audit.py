@@ -0,0 +1,72 @@
+import argparse
+import time
+from collections import Counter
+
+from bloom import BLACKLIST_FILE, BloomFilter
+from validator import RULES, Validator
+
+
+class PasswordAudit:
+    def __init__(self, input_file, output_file=None, blacklist=None):
+        self._input_file = input_file
+        self._output_file = output_file
+        self._blacklist = blacklist
+        self.total = 0
+        self.weak = 0
+        self.rule_failures = dict.fromkeys(RULES.values(), 0)
+
+    def _passwords(self):
+        # NOTE: Dumps are rarely clean UTF-8, surrogateescape keeps every byte instead of failing
+        with open(self._input_file, "r", encoding="utf-8", errors="surrogateescape", newline="\n") as file:
+            for line in file:
+                yield line.rstrip("\r\n")
+
+    def run(self):
+        masks = Counter()
+        output = open(self._output_file, "w", encoding="utf-8") if self._output_file else None
+        try:
+            for line_number, password in enumerate(self._passwords(), 1):
+                failures = Validator.failures(password, self._blacklist)
+                masks[failures] += 1
+                if output:
+                    failed = ",".join(Validator.describe(failures))
+                    output.write(f"{line_number}\t{'WEAK' if failures else 'OK'}\t{failed}\n")
+        finally:
+            if output:
+                output.close()
+
+        # Per-rule totals are expanded once from the distinct failure combinations
+        for failures, count in masks.items():
+            self.total += count
+            if failures:
+                self.weak += count
+            for name in Validator.describe(failures):
+                self.rule_failures[name] += count
+        return self.total, self.weak
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Audit the strength of every password in a file.")
+    parser.add_argument("input", help="file with one password per line")
+    parser.add_argument("--output", help="write '<line>\\t<OK|WEAK>\\t<failed rules>' for every entry")
+    parser.add_argument("--blacklist", default=BLACKLIST_FILE,
+                        help=f"Bloom filter of common passwords, used when it exists (default: {BLACKLIST_FILE})")
+    args = parser.parse_args(args)
+
+    audit = PasswordAudit(args.input, args.output, BloomFilter.load(args.blacklist))
+    start = time.perf_counter()
+    total, weak = audit.run()
+    elapsed = time.perf_counter() - start
+
+    print(f"Passwords: {total}"
+          f"\nStrong: {total - weak}"
+          f"\nWeak: {weak}"
+          f"\nTime: {elapsed:.2f}s ({total / elapsed if elapsed else 0:,.0f} passwords/s)"
+          f"\n\nFailures per rule:")
+    for name, count in audit.rule_failures.items():
+        print(f"  {name:<22} {count:>10} ({count / total if total else 0:.1%})")
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
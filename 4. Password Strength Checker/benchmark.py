@@ -0,0 +1,61 @@
+import random
+import re
+import string
+import sys
+import time
+
+from validator import PASSWORD_PATTERN, Validator
+
+ALPHABET = string.ascii_letters + string.digits + string.punctuation + " _éß٣\n\r"
+
+
+def make_passwords(count):
+    random.seed(3)
+    passwords = []
+    for _ in range(count):
+        length = random.randint(0, 16)
+        pool = random.choice([ALPHABET, string.ascii_lowercase, string.ascii_letters, string.digits + "aB"])
+        passwords.append("".join(random.choice(pool) for _ in range(length)))
+    return passwords
+
+
+def regex_check(passwords):
+    return [PASSWORD_PATTERN.match(password) is not None for password in passwords]
+
+
+RULE_PATTERNS = [re.compile(rule) for rule in (r".*[a-z]", r".*[A-Z]", r".*[0-9]", r".*[\w]", r".{8,}")]
+
+
+def regex_rules(passwords):
+    # Per-rule statistics need every lookahead run on its own
+    return [[rule.match(password) is None for rule in RULE_PATTERNS] for password in passwords]
+
+
+def scanner_check(passwords):
+    return [Validator.failures(password) == 0 for password in passwords]
+
+
+def timed(function, passwords):
+    start = time.perf_counter()
+    result = function(passwords)
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    passwords = make_passwords(count)
+
+    expected, regex_time = timed(regex_check, passwords)
+    _, rules_time = timed(regex_rules, passwords)
+    result, scanner_time = timed(scanner_check, passwords)
+    mismatches = [password for password, a, b in zip(passwords, expected, result) if a != b]
+
+    print(f"Passwords: {count}")
+    print(f"Regex (4 lookaheads): {regex_time:.3f}s ({count / regex_time:,.0f}/s)")
+    print(f"Regex per rule      : {rules_time:.3f}s ({count / rules_time:,.0f}/s)")
+    print(f"Single scan         : {scanner_time:.3f}s ({count / scanner_time:,.0f}/s)")
+    print(f"Mismatches: {len(mismatches)} {mismatches[:5]}")
+
+
+if __name__ == "__main__":
+    main()
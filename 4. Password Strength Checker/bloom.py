@@ -0,0 +1,104 @@
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import struct
+import time
+
+BLACKLIST_FILE = "common_passwords.bloom"
+FALSE_POSITIVE_RATE = 0.001
+MAGIC = b"PWBLOOM1"
+HEADER = struct.Struct("<8sQQQ")  # magic, bits, hashes, items
+
+
+class BloomFilter:
+    def __init__(self, file_name):
+        self._file = open(file_name, "rb")
+        # NOTE: The bit array is mapped, not read, so opening is instant and pages load on demand
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._bits, self._hashes, self.items = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{file_name} is not a password Bloom filter")
+
+    @staticmethod
+    def load(file_name=BLACKLIST_FILE):
+        if not os.path.exists(file_name):
+            return None
+        return BloomFilter(file_name)
+
+    @staticmethod
+    def _positions(word, bits, hashes):
+        digest = hashlib.blake2b(word.encode("utf-8", "surrogateescape"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        # Double hashing: k positions from two independent 64-bit hashes
+        return ((first + i * second) % bits for i in range(hashes))
+
+    def __contains__(self, word):
+        for position in self._positions(word, self._bits, self._hashes):
+            if not self._map[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def false_positive_rate(self):
+        return (1 - math.exp(-self._hashes * self.items / self._bits)) ** self._hashes
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    @staticmethod
+    def _words(wordlist):
+        with open(wordlist, "r", encoding="utf-8", errors="surrogateescape", newline="\n") as file:
+            for line in file:
+                word = line.rstrip("\r\n")
+                if word:
+                    yield word
+
+    @staticmethod
+    def build(wordlist, file_name=BLACKLIST_FILE, false_positive_rate=FALSE_POSITIVE_RATE):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+
+        items = sum(1 for _ in BloomFilter._words(wordlist))
+        bits = max(64, math.ceil(-items * math.log(false_positive_rate) / math.log(2) ** 2))
+        hashes = max(1, round(bits / max(items, 1) * math.log(2)))
+
+        # NOTE: Bits are set straight into a mapped temp file, so memory stays flat for any wordlist size
+        temp_name = file_name + ".tmp"
+        with open(temp_name, "wb+") as file:
+            file.truncate(HEADER.size + (bits + 7) // 8)
+            with mmap.mmap(file.fileno(), 0) as bit_map:
+                for word in BloomFilter._words(wordlist):
+                    for position in BloomFilter._positions(word, bits, hashes):
+                        bit_map[HEADER.size + (position >> 3)] |= 1 << (position & 7)
+                HEADER.pack_into(bit_map, 0, MAGIC, bits, hashes, items)
+                bit_map.flush()
+        os.replace(temp_name, file_name)
+        return items, bits, hashes
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Build a Bloom filter of common passwords from a wordlist.")
+    parser.add_argument("wordlist", help="file with one password per line")
+    parser.add_argument("--output", default=BLACKLIST_FILE, help=f"filter file (default: {BLACKLIST_FILE})")
+    parser.add_argument("--fp-rate", type=float, default=FALSE_POSITIVE_RATE,
+                        help=f"target false positive rate (default: {FALSE_POSITIVE_RATE})")
+    args = parser.parse_args(args)
+    if not 0 < args.fp_rate < 1:
+        parser.error(f"--fp-rate must be between 0 and 1 (exclusive), got {args.fp_rate}")
+
+    start = time.perf_counter()
+    items, bits, hashes = BloomFilter.build(args.wordlist, args.output, args.fp_rate)
+    print(f"Passwords: {items}"
+          f"\nFilter size: {(bits + 7) // 8 / 2**20:.2f} MB ({bits / max(items, 1):.1f} bits per password)"
+          f"\nHash functions: {hashes}"
+          f"\nTime: {time.perf_counter() - start:.2f}s"
+          f"\nSaved to {args.output}")
+
+
+# NOTE: Test Code
+if __name__ == "__main__":
+    print("What the Hell are you doing? \nThis is not the Main File.\nPlease run the main.py file.")
@@ -1,12 +1,25 @@
+import sys
+import audit
+import bloom
 from validator import Validator
 
+if len(sys.argv) > 1 and sys.argv[1] == "build-blacklist":
+    # bloom.main reports a missing wordlist with its usage message
+    bloom.main(sys.argv[2:])
+    exit()
+elif len(sys.argv) > 1:
+    audit.main(sys.argv[1:])
+    exit()
+
+blacklist = bloom.BloomFilter.load()
+
 print("="*40)
 print("Password Strength Checker".center(40))
 print("="*40)
 
 while True:
     password = input("Enter a Password: ")
-    validator = Validator(password)
+    validator = Validator(password, blacklist)
     if validator.is_valid():
         print("Password is Valid.\n")
     else:
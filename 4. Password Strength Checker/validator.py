@@ -1,12 +1,61 @@
 import re
+import string
+
+# NOTE: Reference pattern, failures() checks the same rules in one scan of the password
+PASSWORD_PATTERN = re.compile(r'(?=.*[a-z])(?=.*[A-Z])(?=.*[0-9])(?=.*[\w]).{8,}')
+
+MIN_LENGTH = 8
+LOWERCASE = 1
+UPPERCASE = 2
+DIGIT = 4
+WORD = 8
+LENGTH = 16
+COMMON = 32
+RULES = {
+    LOWERCASE: "lowercase",
+    UPPERCASE: "uppercase",
+    DIGIT: "digit",
+    WORD: "word character",
+    LENGTH: f"length >= {MIN_LENGTH}",
+    COMMON: "not a common password",
+}
+CHARACTER_RULES = LOWERCASE | UPPERCASE | DIGIT | WORD | LENGTH
+
+LOWERCASE_CHARS = frozenset(string.ascii_lowercase)
+UPPERCASE_CHARS = frozenset(string.ascii_uppercase)
+DIGIT_CHARS = frozenset(string.digits)
+
 
 class Validator:
-    def __init__(self, password):
+    def __init__(self, password, blacklist=None):
         self._password = password
-    
+        self._blacklist = blacklist
+
     def is_valid(self):
-        pattern = r'(?=.*[a-z])(?=.*[A-Z])(?=.*[0-9])(?=.*[\w]).{8,}'
-        if re.match(pattern, self._password):
-            return True
-        else:
-            return False
+        return self.failures(self._password, self._blacklist) == 0
+
+    @staticmethod
+    def failures(password, blacklist=None):
+        # "." in the reference pattern stops at a newline, so only the first line is checked
+        password = password.partition("\n")[0]
+        found = LENGTH if len(password) >= MIN_LENGTH else 0
+
+        # NOTE: The password is scanned once to build the set, every rule then only looks at distinct characters
+        chars = set(password)
+        if not chars.isdisjoint(LOWERCASE_CHARS):
+            found |= LOWERCASE | WORD
+        if not chars.isdisjoint(UPPERCASE_CHARS):
+            found |= UPPERCASE | WORD
+        if not chars.isdisjoint(DIGIT_CHARS):
+            found |= DIGIT | WORD
+        if not found & WORD and any(char.isalnum() or char == "_" for char in chars):
+            found |= WORD
+
+        failures = CHARACTER_RULES & ~found
+        if blacklist is not None and password in blacklist:
+            failures |= COMMON
+        return failures
+
+    @staticmethod
+    def describe(failures):
+        return [name for rule, name in RULES.items() if failures & rule]
@@ -0,0 +1,90 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from filter import Filter
+
+
+def make_records(file_name, count, ids):
+    # id,name,payload lines with ids drawn from range(ids), the repeats with a new payload
+    random.seed(6)
+    with open(file_name, "w", encoding="utf-8") as file:
+        for _ in range(count):
+            user = random.randrange(ids)
+            file.write(f"{user},user{user},{random.random():.12f}\n")
+
+
+def old_remove_duplicates(file_name):
+    with open(file_name, "r", encoding="utf-8") as file:
+        return list(set(file.read().splitlines()))
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    # Timed without tracemalloc, it slows Python code down several times
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def read(file_name):
+    with open(file_name, "r", encoding="utf-8") as file:
+        return file.read().splitlines()
+
+
+def by_field(input_file, output_file, count, title):
+    seen = set()
+    expected = []
+    for line in read(input_file):
+        key = line.split(",", 1)[0]
+        if key not in seen:
+            seen.add(key)
+            expected.append(line)
+    distinct = len(seen)
+    seen = None
+    limit = distinct // 20
+    # About 10 bits per key that is spilled, a false positive rate around 1%
+    bloom = (distinct - limit) * 10 // 8
+    print(f"\n{title:<34} {'Time':>7} {'Peak':>10}  Kept {len(expected)}")
+    for label, memory_limit, bloom_size in (("Streaming, in memory", distinct + 1, 0),
+                                            (f"Spilled, limit {limit}", limit, 0),
+                                            (f"Spilled + Bloom {bloom / 2**20:.1f} MB", limit, bloom)):
+        duplicate_filter = Filter(memory_limit, 0, ",", bloom_size)
+        (kept, removed), elapsed, peak = measure(duplicate_filter.dedupe_file, input_file, output_file)
+        assert read(output_file) == expected and kept + removed == count
+        print(f"{label:<34} {elapsed:>6.2f}s {peak / 2**20:>7.1f} MB  True")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as folder:
+        input_file = os.path.join(folder, "records.csv")
+        output_file = os.path.join(folder, "unique.csv")
+        make_records(input_file, count, count // 2)
+        lines = read(input_file)
+        print(f"{count} records, {os.path.getsize(input_file) / 2**20:.0f} MB")
+
+        old, elapsed, peak = measure(old_remove_duplicates, input_file)
+        print(f"\n{'By whole line':<34} {'Time':>7} {'Peak':>10}  Order")
+        print(f"{'Old list(set(...))':<34} {elapsed:>6.2f}s {peak / 2**20:>7.1f} MB  {old == list(dict.fromkeys(lines))}")
+        expected = list(dict.fromkeys(lines))
+        _, elapsed, peak = measure(Filter().dedupe_file, input_file, output_file)
+        assert read(output_file) == expected
+        print(f"{'Streaming, in memory':<34} {elapsed:>6.2f}s {peak / 2**20:>7.1f} MB  True")
+        lines = expected = None
+
+        by_field(input_file, output_file, count, "By id, each id about twice")
+        # Few repeats, the case the Bloom filter is for
+        make_records(input_file, count, count * 100)
+        by_field(input_file, output_file, count, "By id, 1% repeated")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,237 @@
+import heapq
+import os
+import tempfile
+from itertools import islice
+from operator import itemgetter
+
+MEMORY_LIMIT = 1_000_000
+PARTITION_BITS = 6
+PARTITIONS = 1 << PARTITION_BITS
+BLOOM_HASHES = 4
+MASK = (1 << 64) - 1
+
 
 class Filter:
-    def __init__(self):
-        pass
-    
+    def __init__(self, memory_limit=MEMORY_LIMIT, key_field=None, delimiter=",", bloom_size=0):
+        # key_field=None compares whole lines, otherwise only that field (counted from 0).
+        # bloom_size is the Bloom prefilter size in bytes, 0 turns it off.
+        self.memory_limit = memory_limit
+        self.key_field = key_field
+        self.delimiter = delimiter
+        self.bloom_size = bloom_size
+
     def remove_duplicates(self, duplicated_list):
-        return list(set(duplicated_list))
\ No newline at end of file
+        # dict keeps insertion order, so the first occurrence of each element stays where it was
+        return list(dict.fromkeys(duplicated_list))
+
+    def _key(self, line):
+        if self.key_field is None:
+            return line
+        fields = line.split(self.delimiter)
+        if self.key_field >= len(fields):
+            raise ValueError(f"line has no field {self.key_field}: {line!r}")
+        return fields[self.key_field]
+
+    def dedupe_lines(self, lines, folder=None):
+        # Yields every line whose key was not seen before, in input order.
+        # NOTE: While fewer than memory_limit keys have been seen it is a plain set and lines
+        # come out as they are read. After that the set is frozen: a key in it is a duplicate,
+        # anything else is numbered and spilled to disk, checked there, and merged back into
+        # input order by number at the end. The checks on disk never need the frozen set, it is
+        # dropped once the spill is written, so at most memory_limit keys are held at any time
+        # (plus bloom_size bytes for the Bloom filter).
+        seen = set()
+        lines = iter(lines)
+        for line in lines:
+            line = line.rstrip("\n")
+            key = self._key(line)
+            if key not in seen:
+                seen.add(key)
+                yield line
+                if len(seen) >= self.memory_limit:
+                    break
+        else:
+            return
+
+        with tempfile.TemporaryDirectory(dir=folder) as temp_folder:
+            # The generator holds the only reference, the set is freed when it is exhausted
+            records = self._unseen(seen, lines)
+            seen = None
+            if self.bloom_size:
+                yield from self._bloom_pass(records, temp_folder)
+            else:
+                yield from self._partition_pass(((number, "L", line, key) for number, line, key in records),
+                                                temp_folder)
+
+    def _unseen(self, seen, lines):
+        # Numbered lines whose key is not in the frozen set, the numbers put them back in order later
+        for number, line in enumerate(lines):
+            line = line.rstrip("\n")
+            key = self._key(line)
+            if key not in seen:
+                yield number, line, key
+
+    def _bloom_pass(self, records, temp_folder):
+        # NOTE: A Bloom filter of the keys spilled so far. A key with any of its bits still 0
+        # has certainly not been seen, so most unique lines go to the firsts file without an
+        # exact check. Only the rest, repeats and the odd false positive, go to the maybes file.
+        bloom = bytearray(self.bloom_size)
+        bits = self.bloom_size * 8
+        firsts_name = os.path.join(temp_folder, "firsts.txt")
+        maybes_name = os.path.join(temp_folder, "maybes.txt")
+        with open(firsts_name, "w", encoding="utf-8", errors="surrogatepass", newline="\n") as firsts, \
+                open(maybes_name, "w", encoding="utf-8", errors="surrogatepass", newline="\n") as maybes:
+            written = 0
+            for number, line, key in records:
+                # Kirsch-Mitzenmacher double hashing, BLOOM_HASHES bits from the two halves of one hash
+                value = hash(key) & MASK
+                second = value >> 32 | 1
+                new = False
+                for position in range(value & 0xFFFFFFFF, (value & 0xFFFFFFFF) + BLOOM_HASHES * second, second):
+                    position %= bits
+                    bit = 1 << (position & 7)
+                    if not bloom[position >> 3] & bit:
+                        bloom[position >> 3] |= bit
+                        new = True
+                # Firsts need no number, a maybe keeps how many firsts came before it instead
+                if new:
+                    firsts.write(line)
+                    firsts.write("\n")
+                    written += 1
+                else:
+                    maybes.write(f"{written}\t{line}\n")
+        bloom = None
+
+        # A first is always the earliest line with its key, otherwise that line would have set
+        # its bits. So a maybe is a duplicate exactly when its key came before it as a first or
+        # as an earlier maybe, and only the keys that appear among the maybes need remembering.
+        # One dict of those keys, set to True once the key has been seen, is all that is held.
+        maybe_keys = {}
+        for _, line in self._read_records(maybes_name):
+            key = self._key(line)
+            if key not in maybe_keys:
+                if len(maybe_keys) >= self.memory_limit:
+                    break
+                maybe_keys[key] = False
+        else:
+            for first, line in self._in_order(firsts_name, maybes_name):
+                if first:
+                    if maybe_keys:
+                        key = self._key(line)
+                        if key in maybe_keys:
+                            maybe_keys[key] = True
+                    yield line
+                else:
+                    key = self._key(line)
+                    if not maybe_keys[key]:
+                        maybe_keys[key] = True
+                        yield line
+            return
+
+        # Too many keys repeat to remember them all, split everything by hash instead
+        maybe_keys = None
+        yield from self._partition_pass(((number, "F" if first else "L", line, self._key(line))
+                                         for number, (first, line) in enumerate(self._in_order(firsts_name, maybes_name))),
+                                        temp_folder)
+
+    def _in_order(self, firsts_name, maybes_name):
+        # Both files back in input order, as (is a first, line)
+        with open(firsts_name, "r", encoding="utf-8", errors="surrogatepass", newline="\n") as firsts:
+            done = 0
+            for position, line in self._read_records(maybes_name):
+                for first in islice(firsts, position - done):
+                    yield True, first.rstrip("\n")
+                done = position
+                yield False, line
+            for first in firsts:
+                yield True, first.rstrip("\n")
+
+    def _partition_pass(self, records, temp_folder):
+        # Every record goes to one of PARTITIONS files by the low bits of its key's hash,
+        # equal keys always land in the same file, so each file is checked on its own
+        names = [os.path.join(temp_folder, f"part{index}.txt") for index in range(PARTITIONS)]
+        partitions = [open(name, "w", encoding="utf-8", errors="surrogatepass", newline="\n") for name in names]
+        try:
+            for number, flag, line, key in records:
+                partitions[hash(key) & (PARTITIONS - 1)].write(f"{number}\t{flag}{line}\n")
+        finally:
+            for partition in partitions:
+                partition.close()
+
+        kept_files = [self._resolve(name, 1) for name in names]
+        readers = [self._read_records(name) for name in kept_files]
+        try:
+            for _, line in heapq.merge(*readers, key=itemgetter(0)):
+                yield line
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def _resolve(self, file_name, level):
+        # Exact check of one partition, the lines kept are written in input order to
+        # a .kept file and its name is returned. A partition with more than memory_limit
+        # keys is split again by the next 6 bits of the hash, and what the parts kept is
+        # merged back into one file, so at most PARTITIONS files are ever merged at once.
+        kept_name = file_name + ".kept"
+        shift = PARTITION_BITS * level
+        seen = set()
+        with open(file_name, "r", encoding="utf-8", errors="surrogatepass", newline="\n") as partition, \
+                open(kept_name, "w", encoding="utf-8", errors="surrogatepass", newline="\n") as kept:
+            for record in partition:
+                number, payload = record.rstrip("\n").split("\t", 1)
+                key = self._key(payload[1:])
+                # F lines are known to be first, L lines are checked
+                if payload[0] == "F" or key not in seen:
+                    # Past the end of the 64-bit hash every level would split the same way
+                    if len(seen) >= self.memory_limit and shift < 64:
+                        break
+                    seen.add(key)
+                    kept.write(f"{number}\t{payload[1:]}\n")
+            else:
+                os.remove(file_name)
+                return kept_name
+
+        os.remove(kept_name)
+        seen = None
+        names = [f"{file_name}.{index}" for index in range(PARTITIONS)]
+        parts = [open(name, "w", encoding="utf-8", errors="surrogatepass", newline="\n") for name in names]
+        try:
+            with open(file_name, "r", encoding="utf-8", errors="surrogatepass", newline="\n") as partition:
+                for record in partition:
+                    key = self._key(record.split("\t", 1)[1].rstrip("\n")[1:])
+                    parts[(hash(key) & MASK) >> shift & (PARTITIONS - 1)].write(record)
+        finally:
+            for part in parts:
+                part.close()
+        os.remove(file_name)
+        kept_files = [self._resolve(name, level + 1) for name in names]
+        readers = [self._read_records(name) for name in kept_files]
+        with open(kept_name, "w", encoding="utf-8", errors="surrogatepass", newline="\n") as kept:
+            for number, line in heapq.merge(*readers, key=itemgetter(0)):
+                kept.write(f"{number}\t{line}\n")
+        for name in kept_files:
+            os.remove(name)
+        return kept_name
+
+    @staticmethod
+    def _read_records(file_name):
+        with open(file_name, "r", encoding="utf-8", errors="surrogatepass", newline="\n") as file:
+            for record in file:
+                number, line = record.rstrip("\n").split("\t", 1)
+                yield int(number), line
+
+    def dedupe_file(self, input_file, output_file):
+        # Returns (kept, removed)
+        kept = total = 0
+        with open(input_file, "r", encoding="utf-8", errors="surrogatepass", newline="\n") as source, \
+                open(output_file, "w", encoding="utf-8", errors="surrogatepass", newline="\n") as output:
+            def counted(lines):
+                nonlocal total
+                for line in lines:
+                    total += 1
+                    yield line
+            for line in self.dedupe_lines(counted(source), os.path.dirname(os.path.abspath(output_file))):
+                output.write(line)
+                output.write("\n")
+                kept += 1
+        return kept, total - kept
@@ -1,7 +1,33 @@
 
-from filter import Filter
+import argparse
+import sys
+
+from filter import MEMORY_LIMIT, Filter
+
+
+def dedupe_file(args=None):
+    parser = argparse.ArgumentParser(description="Remove duplicate lines from a file, keeping the first one of each in its place.")
+    parser.add_argument("input", help="file to read")
+    parser.add_argument("output", help="file to write the lines without duplicates to")
+    parser.add_argument("--field", type=int, help="compare only this field of each line, counted from 0 (default: the whole line)")
+    parser.add_argument("--delimiter", default=",", help="field delimiter for --field (default: ,)")
+    parser.add_argument("--memory-limit", type=int, default=MEMORY_LIMIT, help=f"keys kept in memory before spilling to disk (default: {MEMORY_LIMIT})")
+    parser.add_argument("--bloom", type=float, default=0, help="size of the Bloom prefilter in MB (default: 0, off)")
+    args = parser.parse_args(args)
+
+    duplicate_filter = Filter(args.memory_limit, args.field, args.delimiter, int(args.bloom * 2**20))
+    try:
+        kept, removed = duplicate_filter.dedupe_file(args.input, args.output)
+    except (OSError, ValueError) as error:
+        print(error)
+        return
+    print(f"Kept: {kept}, removed: {removed}")
+
+
+if len(sys.argv) > 1:
+    dedupe_file()
+    exit()
 
 duplicated_list = [2, 3, 4, 5, 2, 3, 2, 1, 8]
 filter = Filter()
 print(filter.remove_duplicates(duplicated_list))
-